@@ -8,6 +8,7 @@ import argparse
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 import polars as pl
 
@@ -23,10 +24,14 @@ from entropyguard.core.pipeline import Pipeline
 from entropyguard.core.types import PipelineConfig
 
 
-def main() -> int:
+def main(argv: Optional[list[str]] = None) -> int:
     """
     Main entry point for EntropyGuard CLI.
 
+    Args:
+        argv: Command-line arguments without the program name
+            (None = sys.argv[1:])
+
     Returns:
         Exit code (0 for success, 1 for failure)
     """
@@ -154,7 +159,7 @@ Examples:
         help="Enable memory profiling during processing",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Handle stdin/stdout
     input_path = args.input
@@ -273,10 +278,10 @@ Examples:
 
         try:
             lf = load_dataset(input_path, show_progress=False)  # Disable progress for auto-detection
-            # Inspect a small materialized sample to infer schema / string columns
-            df_head = lf.head(100).collect()
+            # String columns come from the (lazily inferred) schema; only those
+            # columns are parsed for the small sample used to compare lengths
             string_cols = [
-                col for col in df_head.columns if df_head[col].dtype == pl.Utf8
+                col for col, dtype in lf.schema.items() if dtype == pl.Utf8
             ]
 
             if not string_cols:
@@ -286,18 +291,18 @@ Examples:
                 )
                 return 1
 
-            # Choose the column with the longest average string length (fallback: first)
-            best_col = string_cols[0]
-            best_avg_len = -1.0
-            for col in string_cols:
-                lengths = df_head[col].cast(pl.Utf8).str.len_chars()
-                # Avoid division by zero
-                if len(lengths) == 0:
-                    continue
-                avg_len = float(lengths.mean())
-                if avg_len > best_avg_len:
-                    best_avg_len = avg_len
-                    best_col = col
+            # Average length of every string column in one select over a
+            # 100-row sample
+            avg_lens = lf.head(100).select(
+                pl.col(col).str.len_chars().mean() for col in string_cols
+            ).collect().row(0)
+
+            # Choose the column with the longest average string length (fallback:
+            # first; mean() is None for an empty sample)
+            best_col = max(
+                zip(string_cols, avg_lens),
+                key=lambda col_len: -1.0 if col_len[1] is None else col_len[1],
+            )[0]
 
             text_column = best_col
             print(f"⚠️  Auto-detected text column: '{text_column}'")
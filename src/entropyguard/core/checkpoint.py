@@ -6,12 +6,15 @@ Allows saving intermediate results and resuming from failures.
 
 import json
 import hashlib
+import os
+import stat
 from pathlib import Path
 from typing import Optional, Any
 from dataclasses import dataclass, asdict
 
 import polars as pl
 
+from entropyguard.core.constants import CHECKPOINT_FINGERPRINT_SAMPLE_BYTES
 from entropyguard.core.errors import ValidationError, ProcessingError
 from entropyguard.core.retry import retry_file_operation
 
@@ -21,11 +24,12 @@ class CheckpointMetadata:
     """Metadata for a checkpoint."""
     stage: str  # e.g., "after_sanitize", "after_exact_dedup", "after_semantic_dedup"
     input_path: str
-    input_hash: str  # Hash of input file for validation
+    input_hash: str  # Fingerprint of input file for validation
     config_hash: str  # Hash of config for validation
     row_count: int
     checkpoint_path: str
     timestamp: float
+    seq_no: int = 0  # Save order within the checkpoint directory (latest = highest)
 
 
 class CheckpointManager:
@@ -54,18 +58,35 @@ class CheckpointManager:
         self.metadata_file: Optional[Path] = None
         if self.checkpoint_dir:
             self.metadata_file = self.checkpoint_dir / "checkpoint_metadata.json"
+        
+        # Parsed metadata file, keyed by its (mtime_ns, size) when it was read
+        self._metadata_cache: Optional[tuple[tuple[int, int], dict[str, dict[str, Any]]]] = None
     
     def is_enabled(self) -> bool:
         """Check if checkpointing is enabled."""
         return self.checkpoint_dir is not None
     
     def _calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA256 hash of file."""
-        hash_sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+        """
+        Calculate a fingerprint of the input file.
+        
+        Hashes the file size, modification time and the first and last
+        CHECKPOINT_FINGERPRINT_SAMPLE_BYTES bytes (BLAKE2b), so the cost is
+        constant instead of a full read of a possibly multi-GB input on every
+        checkpoint save and resume.
+        """
+        file_stat = os.stat(file_path)
+        fingerprint = hashlib.blake2b(digest_size=32)
+        fingerprint.update(f"{file_stat.st_size}:{file_stat.st_mtime_ns}".encode())
+        
+        if stat.S_ISREG(file_stat.st_mode):
+            sample = CHECKPOINT_FINGERPRINT_SAMPLE_BYTES
+            with open(file_path, "rb") as f:
+                fingerprint.update(f.read(sample))
+                if file_stat.st_size > sample:
+                    f.seek(max(sample, file_stat.st_size - sample))
+                    fingerprint.update(f.read(sample))
+        return fingerprint.hexdigest()
     
     def _calculate_config_hash(self, config_dict: dict[str, Any]) -> str:
         """Calculate hash of configuration."""
@@ -109,7 +130,7 @@ class CheckpointManager:
         except Exception as e:
             # Don't fail pipeline on checkpoint save error
             import logging
-            logging.warning(f"Failed to save checkpoint after retries: {e}")
+            logging.warning("Failed to save checkpoint after retries: %s", e)
             return None
         
         # Calculate hashes for validation
@@ -140,6 +161,12 @@ class CheckpointManager:
         # Load existing metadata
         all_metadata = self._load_all_metadata()
         
+        # Number saves in order, so "latest" doesn't depend on clock resolution
+        metadata.seq_no = 1 + max(
+            (meta_dict.get("seq_no", 0) for meta_dict in all_metadata.values()),
+            default=0,
+        )
+        
         # Update or add this stage's metadata
         all_metadata[metadata.stage] = asdict(metadata)
         
@@ -150,21 +177,51 @@ class CheckpointManager:
         
         try:
             retry_file_operation(write_metadata, max_retries=3)
+            self._cache_metadata(all_metadata)
         except Exception as e:
             # Don't fail pipeline on metadata save error
             import logging
-            logging.warning(f"Failed to save checkpoint metadata after retries: {e}")
+            logging.warning("Failed to save checkpoint metadata after retries: %s", e)
+    
+    def _cache_metadata(self, all_metadata: dict[str, dict[str, Any]]) -> None:
+        """Remember metadata just written, keyed by the metadata file's current stat."""
+        if not self.metadata_file:
+            return
+
+        try:
+            file_stat = self.metadata_file.stat()
+        except OSError:
+            self._metadata_cache = None
+            return
+        self._metadata_cache = ((file_stat.st_mtime_ns, file_stat.st_size), all_metadata)
     
     def _load_all_metadata(self) -> dict[str, dict[str, Any]]:
-        """Load all checkpoint metadata."""
-        if not self.metadata_file or not self.metadata_file.exists():
+        """
+        Load all checkpoint metadata.
+        
+        The parsed file is cached and only re-read when its modification time or
+        size changes, so repeated lookups (find_latest_checkpoint, load_checkpoint,
+        cleanup_checkpoints) cost one stat() instead of an open and JSON parse.
+        """
+        if not self.metadata_file:
             return {}
         
         try:
-            with open(self.metadata_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
+            file_stat = self.metadata_file.stat()
+        except OSError:
+            self._metadata_cache = None
             return {}
+        
+        key = (file_stat.st_mtime_ns, file_stat.st_size)
+        if self._metadata_cache is None or self._metadata_cache[0] != key:
+            try:
+                with open(self.metadata_file, "r", encoding="utf-8") as f:
+                    self._metadata_cache = (key, json.load(f))
+            except Exception:
+                return {}
+        
+        # Shallow copy: callers add and remove stages before writing it back
+        return dict(self._metadata_cache[1])
     
     def find_latest_checkpoint(self) -> Optional[CheckpointMetadata]:
         """
@@ -180,17 +237,12 @@ class CheckpointManager:
         if not all_metadata:
             return None
         
-        # Find latest by timestamp
-        latest: Optional[CheckpointMetadata] = None
-        latest_timestamp = 0.0
-        
-        for stage, meta_dict in all_metadata.items():
-            timestamp = meta_dict.get("timestamp", 0.0)
-            if timestamp > latest_timestamp:
-                latest_timestamp = timestamp
-                latest = CheckpointMetadata(**meta_dict)
-        
-        return latest
+        # Find latest by save order (timestamp for metadata written without seq_no)
+        latest_dict = max(
+            all_metadata.values(),
+            key=lambda meta_dict: (meta_dict.get("seq_no", 0), meta_dict.get("timestamp", 0.0)),
+        )
+        return CheckpointMetadata(**latest_dict)
     
     def load_checkpoint(
         self,
@@ -302,6 +354,7 @@ class CheckpointManager:
                 if self.metadata_file:
                     with open(self.metadata_file, "w", encoding="utf-8") as f:
                         json.dump({latest.stage: asdict(latest)}, f, indent=2)
+                    self._cache_metadata({latest.stage: asdict(latest)})
         else:
             # Remove all checkpoints
             for meta_dict in all_metadata.values():
@@ -312,6 +365,7 @@ class CheckpointManager:
             # Remove metadata file
             if self.metadata_file and self.metadata_file.exists():
                 self.metadata_file.unlink()
+            self._metadata_cache = None
     
     def get_checkpoint_stage(self) -> Optional[str]:
         """
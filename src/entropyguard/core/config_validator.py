@@ -5,7 +5,7 @@ Validates PipelineConfig values with range checks, type validation, and
 clear error messages.
 """
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
@@ -38,6 +38,13 @@ class PipelineConfigModel(BaseModel):
     memory_report_path: Optional[str] = Field(default=None, description="Path to memory report")
     checkpoint_dir: Optional[str] = Field(default=None, description="Directory for checkpoints")
     resume: bool = Field(default=False, description="Resume from checkpoint")
+    semantic_index_type: Literal["auto", "flat", "ivfflat", "ivfpq", "hnsw"] = Field(
+        default="auto", description="FAISS index type for semantic deduplication"
+    )
+    semantic_quantization: Literal["none", "fp16", "int8", "binary"] = Field(
+        default="none", description="Vector quantization for the flat semantic index"
+    )
+    use_gpu: bool = Field(default=False, description="Use FAISS GPU search when available")
     
     @field_validator('required_columns')
     @classmethod
@@ -65,6 +72,16 @@ class PipelineConfigModel(BaseModel):
                     raise ValueError(f"Invalid separator in chunk_separators: {sep}")
         return v
     
+    @model_validator(mode='after')
+    def validate_semantic_quantization(self) -> 'PipelineConfigModel':
+        """Validate that quantization is only combined with a flat index."""
+        if self.semantic_quantization != "none" and self.semantic_index_type not in ("auto", "flat"):
+            raise ValueError(
+                f"semantic_quantization ({self.semantic_quantization}) requires "
+                f"semantic_index_type 'flat' or 'auto', got '{self.semantic_index_type}'"
+            )
+        return self
+    
     @model_validator(mode='after')
     def validate_chunk_overlap(self) -> 'PipelineConfigModel':
         """Validate that chunk_overlap < chunk_size."""
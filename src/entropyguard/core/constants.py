@@ -5,11 +5,13 @@ Centralized configuration values to avoid magic numbers throughout the codebase.
 """
 
 # Chunk sizes for processing
-PII_REMOVAL_CHUNK_SIZE = 1_000_000  # Process 1M rows at a time for PII removal
 STDIN_CHUNK_SIZE = 64 * 1024  # 64KB chunks for stdin streaming
+CHECKPOINT_FINGERPRINT_SAMPLE_BYTES = 64 * 1024  # Head/tail bytes hashed per input file
 
 # Default values
 DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_EMBED_BATCH_SIZE = 64  # Texts per model forward pass
+DEFAULT_EMBED_CACHE_SIZE = 0  # Embeddings kept across Pipeline.run() calls; 0 = no cache
 DEFAULT_MIN_LENGTH = 50
 DEFAULT_DEDUP_THRESHOLD = 0.95
 DEFAULT_CHUNK_OVERLAP = 50
@@ -18,6 +20,9 @@ DEFAULT_CHUNK_OVERLAP = 50
 PROGRESS_BAR_MINITERS_ROWS = 1000  # Update every 1000 rows
 PROGRESS_BAR_MINITERS_BATCHES = 1  # Update every batch
 
+# Semantic index selection ("auto" switches from exact flat search to IVF-PQ at this size)
+IVFPQ_AUTO_MIN_ROWS = 50_000
+
 # Resource limits (for future implementation)
 MAX_MEMORY_MB = None  # None = no limit (to be implemented)
 MAX_ROWS = None  # None = no limit (to be implemented)
@@ -11,9 +11,12 @@ Production-grade with:
 from __future__ import annotations
 
 import hashlib
-import json
+import re
 import sys
-from typing import Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Hashable, Optional
 
 import numpy as np
 import polars as pl
@@ -32,7 +35,11 @@ from entropyguard.core.errors import (
     ResourceError,
     ProcessingError
 )
-from entropyguard.core.resource_guards import check_memory_before_materialization
+from entropyguard.core.resource_guards import (
+    check_memory_before_materialization,
+    estimate_file_size_mb,
+    parquet_row_count,
+)
 from entropyguard.core.types import PipelineConfig, PipelineResult, PipelineStats
 from entropyguard.core.sanitization_lazy import sanitize_lazyframe
 from entropyguard.core.memory_profiler import MemoryProfiler
@@ -40,6 +47,11 @@ from entropyguard.core.checkpoint import CheckpointManager
 from entropyguard.core.logger import get_logger
 from entropyguard.core.retry import retry_file_operation
 from entropyguard.core.progress_tracker import PipelineProgress
+from entropyguard.core.constants import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_EMBED_CACHE_SIZE,
+    IVFPQ_AUTO_MIN_ROWS,
+)
 try:
     from entropyguard.core.metrics import (
         pipeline_duration,
@@ -60,6 +72,16 @@ from entropyguard.sanitization import SanitizationConfig
 from entropyguard.chunking import Chunker
 from entropyguard.deduplication import Embedder, VectorIndex
 
+# Runs of whitespace collapsed to a single space before exact-duplicate hashing
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# The same whitespace set as a Polars (Rust) regex: Rust's \s lacks the
+# \x1c-\x1f separators that Python's str \s matches
+_POLARS_WHITESPACE_PATTERN = r"[\s\x1c-\x1f]+"
+
+# Columns of the audit log (one row per dropped input row)
+AUDIT_EVENT_SCHEMA = {"row_index": pl.Int64, "reason": pl.Utf8, "details": pl.Utf8}
+
 
 def calculate_text_hash(text: str) -> str:
     """
@@ -74,16 +96,16 @@ def calculate_text_hash(text: str) -> str:
     Returns:
         Hexadecimal hash string
     """
-    # Normalize text for consistent hashing
-    normalized = text.lower().strip()
-    normalized = " ".join(normalized.split())  # Normalize whitespace
+    # Normalize text for consistent hashing (collapse whitespace with one
+    # precompiled regex pass instead of building a split() list per row)
+    normalized = _WHITESPACE_RE.sub(" ", text.lower()).strip().encode('utf-8')
     
     if HAS_XXHASH:
         # xxhash is faster and non-cryptographic (perfect for deduplication)
-        return xxhash.xxh64(normalized.encode('utf-8')).hexdigest()
+        return xxhash.xxh64(normalized).hexdigest()
     else:
         # Fallback to MD5 (slower but always available)
-        return hashlib.md5(normalized.encode('utf-8')).hexdigest()
+        return hashlib.md5(normalized).hexdigest()
 
 
 def calculate_cost_savings(
@@ -119,21 +141,142 @@ class Pipeline:
     Production-grade pipeline with memory safety and progress tracking.
     """
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        half_precision: bool = False,
+        embed_cache_size: int = DEFAULT_EMBED_CACHE_SIZE,
+        reuse_trained_index: bool = False,
+    ) -> None:
         """Initialize the pipeline with all required components.
 
         Args:
             model_name: Name of the sentence-transformers model to use for embeddings.
                         Default: "all-MiniLM-L6-v2".
+            embed_batch_size: Number of texts per embedding model forward pass.
+                              Default: 64.
+            half_precision: Run the embedding model in float16 on GPU. Default: False.
+            embed_cache_size: Maximum number of embeddings kept (LRU) across run()
+                              calls on this pipeline, keyed by a hash of the exact text.
+                              Only useful when one Pipeline processes overlapping
+                              inputs repeatedly. Default: 0 (disabled).
+            reuse_trained_index: Keep the trained IVF index of one run() and reuse
+                                 it in the next instead of retraining. Only for
+                                 repeated runs over the same (or very similar)
+                                 data: centroids trained on other data lower
+                                 duplicate recall. Default: False.
         """
         self.validator = DataValidator()
         self.chunker: Optional[Chunker] = None
-        self.embedder = Embedder(model_name=model_name)
+        self.embedder = Embedder(
+            model_name=model_name,
+            batch_size=embed_batch_size,
+            half_precision=half_precision,
+            # Unit-length vectors: inner product == cosine similarity in the index
+            normalize_embeddings=True,
+        )
         self.index: Optional[VectorIndex] = None
-        self.audit_events: list[dict[str, Any]] = []
+        # Audit events are kept columnar: one (row_index, reason, details) frame per
+        # stage, instead of one Python dict per dropped row
+        self._audit_frames: list[pl.DataFrame] = []
         self.memory_profiler: Optional[MemoryProfiler] = None
         self.checkpoint_manager: Optional[CheckpointManager] = None
         self.progress_tracker: Optional[PipelineProgress] = None
+        # LRU cache of embeddings keyed by the Stage 1 text hash (shared across run() calls)
+        self.embed_cache_size = embed_cache_size
+        self._embed_cache: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        # Trained (empty) IVF index from a previous run() call, so repeated runs
+        # skip re-training the coarse/product quantizers (opt-in)
+        self.reuse_trained_index = reuse_trained_index
+        self._trained_index_cache: Any = None
+    
+    def _add_audit_events(
+        self,
+        row_index: pl.Series,
+        reason: pl.Series | str,
+        details: pl.Series | str
+    ) -> None:
+        """
+        Record audit events for dropped rows.
+        
+        Args:
+            row_index: Original row indices of the dropped rows
+            reason: Reason per row, or one reason for all rows
+            details: Details per row, or one detail string for all rows
+        """
+        if row_index.len() == 0:
+            return
+        frame = pl.DataFrame({"row_index": row_index.cast(pl.Int64)}).with_columns(
+            pl.lit(reason).cast(pl.Utf8).alias("reason"),
+            pl.lit(details).cast(pl.Utf8).alias("details"),
+        )
+        self._audit_frames.append(frame)
+    
+    def _audit_frame(self) -> pl.DataFrame:
+        """All audit events recorded in the current run as one DataFrame."""
+        if not self._audit_frames:
+            return pl.DataFrame(schema=AUDIT_EVENT_SCHEMA)
+        return pl.concat(self._audit_frames)
+    
+    @property
+    def audit_events(self) -> list[dict[str, Any]]:
+        """Audit events of the last run as a list of dicts (materialized on access)."""
+        return self._audit_frame().to_dicts()
+    
+    @property
+    def audit_counts(self) -> dict[str, int]:
+        """Number of audit events of the last run per reason.
+        
+        Counted on the columnar audit frame, so callers that only need totals
+        (e.g. to gate on duplicates) don't materialize audit_events.
+        """
+        return dict(self._audit_frame()["reason"].value_counts().iter_rows())
+    
+    def _embed_with_cache(
+        self,
+        texts: list[str],
+        text_hashes: Optional[list[Hashable]] = None
+    ) -> np.ndarray:
+        """
+        Embed texts, reusing cached vectors for previously seen texts.
+        
+        Only cache misses are sent to the embedder. The cache is bounded by
+        embed_cache_size and evicts least recently used entries.
+        
+        Args:
+            texts: Texts to embed
+            text_hashes: Hashes of the exact texts sent to the embedder, aligned
+                         with ``texts`` (None = no caching). Not the Stage 1
+                         normalized hash: texts differing only in case or
+                         whitespace can embed differently.
+        
+        Returns:
+            NumPy array of shape (len(texts), dimension)
+        """
+        if not texts or text_hashes is None or self.embed_cache_size <= 0:
+            return self.embedder.embed(texts)
+        
+        cache = self._embed_cache
+        miss_positions = [i for i, h in enumerate(text_hashes) if h not in cache]
+        if miss_positions:
+            miss_embeddings = self.embedder.embed([texts[i] for i in miss_positions])
+            for pos, vector in zip(miss_positions, miss_embeddings):
+                cache[text_hashes[pos]] = vector.copy()
+        
+        if len(miss_positions) == len(texts):
+            # Nothing was cached - use the embedder output directly
+            embeddings = miss_embeddings
+        else:
+            embeddings = np.stack([cache[h] for h in text_hashes])
+        
+        # Refresh recency and evict the oldest entries beyond the cap
+        for h in text_hashes:
+            cache.move_to_end(h)
+        while len(cache) > self.embed_cache_size:
+            cache.popitem(last=False)
+        
+        return embeddings
     
     def run(self, config: PipelineConfig) -> PipelineResult:
         """
@@ -169,6 +312,8 @@ class Pipeline:
             "chunk_overlap": config.chunk_overlap,
             "model_name": config.model_name,
             "batch_size": config.batch_size,
+            "semantic_index_type": config.semantic_index_type,
+            "semantic_quantization": config.semantic_quantization,
         }
         
         # Initialize memory profiler if enabled
@@ -184,7 +329,7 @@ class Pipeline:
             pipeline_timer = None
         
         try:
-            self.audit_events = []
+            self._audit_frames = []
             
             # Initialize progress tracker
             self.progress_tracker = PipelineProgress()
@@ -236,9 +381,23 @@ class Pipeline:
             if self.memory_profiler:
                 self.memory_profiler.snapshot("after_load")
             
-            # STEP 2: Validate schema (lazy - metadata only)
+            # Size hints for the memory checks below, so they don't have to count
+            # rows by executing (i.e. fully scanning) the query plan: Parquet row
+            # counts come from the footer, other files are sized from disk
+            materialize_row_count: Optional[int] = None
+            materialize_estimated_mb: Optional[float] = None
+            if Path(config.input_path).is_file():
+                if str(config.input_path).lower().endswith(".parquet"):
+                    materialize_row_count = parquet_row_count(config.input_path)
+                else:
+                    input_size_mb = estimate_file_size_mb(config.input_path)
+                    if input_size_mb is not None:
+                        materialize_estimated_mb = input_size_mb * 1.5  # Arrow + overhead
+            
+            # STEP 2: Validate schema (lazy - metadata only). The schema is resolved
+            # once: for CSV/NDJSON this infers types by reading the head of the file.
+            schema = lf.schema
             if config.required_columns:
-                schema = lf.schema
                 missing_cols = [
                     col for col in config.required_columns
                     if col not in schema
@@ -252,7 +411,6 @@ class Pipeline:
             # STEP 3: Auto-detect text column (lazy - schema only)
             text_column = config.text_column
             if not text_column:
-                schema = lf.schema
                 string_cols = [
                     col for col, dtype in schema.items()
                     if dtype == pl.Utf8
@@ -293,27 +451,15 @@ class Pipeline:
             if stage_timer:
                 stage_timer.__exit__(None, None, None)
             
-            # STEP 5: Materialize for chunking (if needed)
-            # Chunking requires materialization, but it's acceptable here
-            # because chunking happens before expensive embedding stage
+            # STEP 5: Chunking (lazy - added to the query plan)
+            # Load, sanitize and chunk then run as one streaming pass when the data
+            # is materialized for Stage 1, instead of materializing twice
             if config.chunk_size is not None and config.chunk_size > 0:
                 if HAS_METRICS:
                     record_pipeline_stage(3)  # Chunking
                 if self.progress_tracker:
                     self.progress_tracker.set_stage(3)
                 
-                # Check memory before materialization for chunking
-                has_memory, warning = check_memory_before_materialization(lf, threshold=0.8, logger=logger)
-                if not has_memory:
-                    raise ResourceError(
-                        warning or "Insufficient memory to materialize dataset for chunking",
-                        hint="Disable chunking or process in smaller batches"
-                    )
-                elif warning:
-                    logger.warning("memory_warning", message=warning)
-                
-                df = lf.collect()
-                
                 if self.chunker is None:
                     separators = (
                         config.chunk_separators
@@ -325,8 +471,13 @@ class Pipeline:
                         chunk_overlap=config.chunk_overlap,
                         separators=separators,
                     )
-                df = self.chunker.chunk_dataframe(df, text_col=text_column)
-                lf = df.lazy()
+                lf = self.chunker.chunk_dataframe(lf, text_col=text_column)
+                # Chunking changes the row count; fall back to the on-disk size estimate
+                if materialize_row_count is not None:
+                    materialize_row_count = None
+                    input_size_mb = estimate_file_size_mb(config.input_path)
+                    if input_size_mb is not None:
+                        materialize_estimated_mb = input_size_mb * 1.5  # Arrow + overhead
                 if self.memory_profiler:
                     self.memory_profiler.snapshot("after_chunking")
             
@@ -360,7 +511,13 @@ class Pipeline:
                     self.memory_profiler.snapshot("before_materialize")
                 
                 # Check memory before materialization
-                has_memory, warning = check_memory_before_materialization(lf, threshold=0.8, logger=logger)
+                has_memory, warning = check_memory_before_materialization(
+                    lf,
+                    threshold=0.8,
+                    logger=logger,
+                    row_count=materialize_row_count,
+                    estimated_mb=materialize_estimated_mb
+                )
                 if not has_memory:
                     raise ResourceError(
                         warning or "Insufficient memory to materialize dataset",
@@ -369,7 +526,8 @@ class Pipeline:
                 elif warning:
                     logger.warning("memory_warning", message=warning)
                 
-                df = lf.collect()
+                # Streaming engine runs load + sanitize (+ chunking) batch by batch
+                df = lf.collect(streaming=True)
                 
                 if df.height == 0:
                     raise ValidationError("Input dataset is empty after sanitization")
@@ -409,14 +567,16 @@ class Pipeline:
                         smoothing=0.1  # Smooth ETA calculation
                     )
                 
-                # Use Polars map_elements instead of .to_list() to avoid materialization
-                # This processes in chunks internally by Polars, avoiding full materialization
-                df = df.with_columns(
-                    pl.col(text_column).cast(pl.Utf8).map_elements(
-                        lambda x: calculate_text_hash(str(x) if x is not None else ""),
-                        return_dtype=pl.Utf8
-                    ).alias("_text_hash")
+                # Hash the normalized text natively in Polars (parallel Rust, no
+                # per-row Python calls); same normalization as calculate_text_hash
+                normalized = (
+                    pl.col(text_column)
+                    .cast(pl.Utf8)
+                    .str.to_lowercase()
+                    .str.replace_all(_POLARS_WHITESPACE_PATTERN, " ")
+                    .str.strip_chars(" ")
                 )
+                df = df.with_columns(normalized.hash().alias("_text_hash"))
                 
                 if config.show_progress:
                     pbar.update(df.height)
@@ -426,14 +586,17 @@ class Pipeline:
                     if overall_pbar:
                         overall_pbar.n = 50  # After exact dedup is ~50% of pipeline
                         overall_pbar.refresh()
-                lf_dedup = df.lazy()
-                lf_dedup = lf_dedup.with_columns(
-                    pl.col("_original_index").rank("dense").over("_text_hash").alias("_hash_rank")
+                # Keep the first row per hash (rows are in _original_index order, so
+                # the first occurrence is the lowest index)
+                lf_dedup = df.lazy().unique(
+                    subset="_text_hash", keep="first", maintain_order=True
                 )
-                lf_dedup = lf_dedup.filter(pl.col("_hash_rank") == 1)
                 
                 # Check memory before materialization after exact dedup
-                has_memory, warning = check_memory_before_materialization(lf_dedup, threshold=0.8, logger=logger)
+                # (df.height is an upper bound; counting would run unique() twice)
+                has_memory, warning = check_memory_before_materialization(
+                    lf_dedup, threshold=0.8, logger=logger, row_count=df.height
+                )
                 if not has_memory:
                     raise ResourceError(
                         warning or "Insufficient memory to materialize dataset after exact deduplication",
@@ -469,46 +632,30 @@ class Pipeline:
             # Use Polars operations instead of .to_list() to avoid materialization
             exact_dupes_chars = 0
             if exact_duplicates_removed > 0 and df is not None:
-                # Use Polars set operations instead of Python sets
-                kept_indices = df_after_exact.select("_original_index")
-                all_indices = df.select("_original_index")
-                
-                # Find dropped indices using Polars anti_join
-                dropped_df = all_indices.join(
-                    kept_indices,
+                # Find dropped rows (with their text) in a single Polars anti-join
+                dropped_df = df.select(["_original_index", text_column]).join(
+                    df_after_exact.select("_original_index"),
                     on="_original_index",
                     how="anti"
                 )
                 
-                # Calculate chars for dropped rows (process in chunks if needed)
                 if dropped_df.height > 0:
-                    # Join with original df to get text values
-                    dropped_with_text = dropped_df.join(
-                        df.select(["_original_index", text_column]),
-                        on="_original_index",
-                        how="left"
-                    )
-                    
-                    # Calculate total chars using Polars (no .to_list())
-                    exact_dupes_chars = dropped_with_text.select(
-                        pl.col(text_column).str.len_chars().sum()
+                    # Calculate total chars with one Polars sum (no .to_list())
+                    exact_dupes_chars = dropped_df.select(
+                        pl.col(text_column).cast(pl.Utf8).str.len_chars().sum()
                     ).item() or 0
                     
-                    # Add audit events (process in chunks if needed)
-                    chunk_size = 100_000
-                    for offset in range(0, dropped_df.height, chunk_size):
-                        chunk = dropped_df.slice(offset, chunk_size)
-                        for orig_idx in chunk["_original_index"].to_list():
-                            self.audit_events.append({
-                                "row_index": int(orig_idx),
-                                "reason": "exact_duplicate",
-                                "details": "Exact duplicate removed via hash"
-                            })
+                    self._add_audit_events(
+                        dropped_df["_original_index"],
+                        "exact_duplicate",
+                        "Exact duplicate removed via hash"
+                    )
             
             # STEP 7: Stage 2 - Semantic Deduplication (BATCHED)
             semantic_dupes_chars = 0
             
             # Check if we can resume from semantic dedup checkpoint
+            semantic_resumed = False
             if resume_stage == "after_semantic_dedup" and self.checkpoint_manager:
                 df = self.checkpoint_manager.load_checkpoint(
                     "after_semantic_dedup",
@@ -520,6 +667,7 @@ class Pipeline:
                     stats["after_deduplication_rows"] = df.height
                     stats["semantic_duplicates_removed"] = 0  # Unknown from checkpoint
                     resume_stage = None
+                    semantic_resumed = True
                 else:
                     logger.warning("checkpoint_invalid", stage="after_semantic_dedup", message="Checkpoint invalid or not found, continuing from exact dedup")
                     df = None
@@ -528,7 +676,12 @@ class Pipeline:
                 stats["after_deduplication_rows"] = df_after_exact.height
                 stats["semantic_duplicates_removed"] = 0
                 df = df_after_exact
-            elif df is None and df_after_exact.height > 0:
+            elif semantic_resumed:
+                pass  # df and its stats come from the after_semantic_dedup checkpoint
+            elif df_after_exact.height >= 2 and config.dedup_threshold < 1.0:
+                # Embedding is the most expensive stage, so it is skipped when it cannot
+                # change the result: fewer than two rows have nothing to compare, and a
+                # threshold of 1.0 only matches identical texts, which Stage 1 removed.
                 if self.memory_profiler:
                     self.memory_profiler.snapshot("before_semantic_dedup")
                 
@@ -538,7 +691,7 @@ class Pipeline:
                 # 2. Embed each batch
                 # 3. Add embeddings to FAISS index incrementally
                 # 4. Keep FAISS index + embeddings in memory (only vectors, not text)
-                # 5. After all batches, run find_duplicates() on complete index
+                # 5. After all batches, run find_duplicate_labels() on complete index
                 
                 if HAS_METRICS:
                     record_pipeline_stage(5)  # Semantic deduplication
@@ -554,12 +707,29 @@ class Pipeline:
                 # Instead of materializing entire column with .to_list(), process chunk by chunk
                 # This allows processing 100GB+ files without OOM
                 
-                # Initialize FAISS index
-                self.index = VectorIndex(dimension=384)  # all-MiniLM-L6-v2 dimension
-                
                 # Process in batches (chunked to avoid materializing entire column)
                 batch_size = config.batch_size
                 total_rows = df_after_exact.height
+                
+                # Initialize FAISS index (exact flat search for small inputs, IVF-PQ for large)
+                # (quantized vectors are only supported by the flat index)
+                index_type = config.semantic_index_type
+                if index_type == "auto":
+                    if config.semantic_quantization != "none":
+                        index_type = "flat"
+                    else:
+                        index_type = "ivfpq" if total_rows >= IVFPQ_AUTO_MIN_ROWS else "flat"
+                # Embeddings are normalized by the embedder, so inner product == cosine similarity
+                self.index = VectorIndex(
+                    dimension=self.embedder.dimension,
+                    index_type=index_type,
+                    metric="ip",
+                    quantization=config.semantic_quantization,
+                    use_gpu=config.use_gpu,
+                    trained_index=(
+                        self._trained_index_cache if self.reuse_trained_index else None
+                    ),
+                )
                 total_batches = (total_rows + batch_size - 1) // batch_size
                 
                 if config.show_progress:
@@ -588,36 +758,43 @@ class Pipeline:
                         bar_format="{l_bar}{bar}| {n}/{total} [{elapsed}<{remaining}, {rate_fmt}]"
                     )
                 
-                # Store only row index mappings (NOT embeddings - VectorIndex already stores them)
-                # CRITICAL: We don't store embeddings here - VectorIndex.add_vectors() already stores them
-                # This avoids double materialization of embeddings
-                embedding_to_row_idx: list[int] = []  # Maps embedding index (in VectorIndex) to row index (in df_after_exact)
-                embedding_to_original_idx: list[int] = []  # Maps embedding index to original row index
+                # Embeddings are added in row order, so embedding index == row index in
+                # df_after_exact. VectorIndex stores the vectors; no per-row mapping lists.
                 
-                # Process DataFrame in chunks (no .to_list() on entire column)
-                for batch_offset in range(0, total_rows, batch_size):
+                def embed_batch(batch_offset: int) -> np.ndarray:
                     # Slice DataFrame chunk (Polars is efficient, doesn't copy data)
                     chunk_df = df_after_exact.slice(batch_offset, batch_size)
                     
                     # Extract texts for this chunk only (OK - only batch_size rows)
                     chunk_texts = chunk_df[text_column].to_list()
-                    chunk_original_indices = chunk_df["_original_index"].to_list()
-                    
-                    # Embed batch
-                    batch_embeddings = self.embedder.embed(chunk_texts)
-                    
-                    # Add to FAISS index (VectorIndex stores embeddings internally)
-                    self.index.add_vectors(batch_embeddings)
-                    
-                    # Store only mappings (NOT embeddings - VectorIndex already has them)
-                    for i in range(len(chunk_texts)):
-                        embedding_to_row_idx.append(batch_offset + i)  # Row index in df_after_exact
-                        embedding_to_original_idx.append(int(chunk_original_indices[i]))
+                    chunk_hashes = (
+                        chunk_df[text_column].hash().to_list()
+                        if self.embed_cache_size > 0
+                        else None
+                    )
                     
-                    # Release chunk data from memory (texts, indices, DataFrame)
-                    # Embeddings are stored in VectorIndex, not here
-                    del chunk_texts, chunk_original_indices, chunk_df
+                    # Embed batch (cache hits skip the model forward pass); the
+                    # embedder returns unit-length vectors
+                    return self._embed_with_cache(chunk_texts, chunk_hashes)
+                
+                # Double-buffer the batches: a single worker embeds batch N+1 (torch
+                # releases the GIL) while this thread adds batch N to the index. One
+                # batch in flight bounds the extra memory to one batch of embeddings.
+                batch_offsets = range(0, total_rows, batch_size)
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    pending = executor.submit(embed_batch, batch_offsets[0])
+                    for next_offset in batch_offsets[1:]:
+                        batch_embeddings = pending.result()
+                        pending = executor.submit(embed_batch, next_offset)
+                        
+                        # Add to FAISS index (VectorIndex stores embeddings internally)
+                        self.index.add_vectors(batch_embeddings)
+                        del batch_embeddings
+                        
+                        if config.show_progress:
+                            pbar.update(1)
                     
+                    self.index.add_vectors(pending.result())
                     if config.show_progress:
                         pbar.update(1)
                 
@@ -625,48 +802,34 @@ class Pipeline:
                     pbar.close()
                 
                 # Now find duplicates on complete index
-                # CRITICAL: We need all embeddings in memory for find_duplicates()
+                # CRITICAL: We need all embeddings in memory for find_duplicate_labels()
                 # But we've avoided materializing all text strings at once
-                distance_threshold = (2.0 * (1.0 - config.dedup_threshold)) ** 0.5
-                duplicate_groups = self.index.find_duplicates(threshold=distance_threshold)
+                labels = self.index.find_duplicate_labels(threshold=config.dedup_threshold)
+                if self.reuse_trained_index and self.index.trained_index is not None:
+                    self._trained_index_cache = self.index.trained_index
                 
-                # Map duplicate groups to row indices
-                semantic_duplicate_indices: set[int] = set()
+                # Each row is labelled with the first (lowest-index) row of its group;
+                # every row not labelled with itself is a duplicate
+                keep = labels == np.arange(labels.size)
+                semantic_duplicate_indices = np.flatnonzero(~keep)
                 
-                for group in duplicate_groups:
-                    sorted_group = sorted(group)
-                    if not sorted_group:
-                        continue
-                    
-                    # Keep first, mark rest as duplicates
-                    for dup_emb_idx in sorted_group[1:]:
-                        dup_row_idx = embedding_to_row_idx[dup_emb_idx]
-                        semantic_duplicate_indices.add(dup_row_idx)
-                        
-                        # Get original index for audit
-                        dup_original_idx = embedding_to_original_idx[dup_emb_idx]
-                        
-                        # Calculate chars for audit (need to fetch text from DataFrame)
-                        # This is acceptable because we only do it for duplicates (small subset)
-                        row_data = df_after_exact.filter(pl.col("_original_index") == dup_original_idx)
-                        if row_data.height > 0:
-                            text_val = row_data[text_column][0]
-                            if text_val is not None:
-                                semantic_dupes_chars += len(str(text_val))
-                        
-                        self.audit_events.append({
-                            "row_index": dup_original_idx,
-                            "reason": "semantic_duplicate",
-                            "details": "Semantic duplicate detected"
-                        })
+                if semantic_duplicate_indices.size > 0:
+                    self._add_audit_events(
+                        df_after_exact["_original_index"].gather(semantic_duplicate_indices),
+                        "semantic_duplicate",
+                        "Semantic duplicate detected"
+                    )
                 
                 # Filter DataFrame using Polars operations (no materialization)
-                # Create a boolean mask for rows to keep
-                keep_mask = pl.Series(
-                    [i not in semantic_duplicate_indices for i in range(total_rows)]
-                )
+                keep_mask = pl.Series(keep)
                 df = df_after_exact.filter(keep_mask)
                 
+                # Calculate dropped chars with a single Polars sum over the duplicates
+                if semantic_duplicate_indices.size > 0:
+                    semantic_dupes_chars = df_after_exact.filter(~keep_mask).select(
+                        pl.col(text_column).cast(pl.Utf8).str.len_chars().sum()
+                    ).item() or 0
+                
                 if self.memory_profiler:
                     self.memory_profiler.snapshot("after_semantic_dedup")
                 
@@ -680,7 +843,7 @@ class Pipeline:
                     )
                 
                 stats["after_deduplication_rows"] = df.height
-                stats["semantic_duplicates_removed"] = len(semantic_duplicate_indices)
+                stats["semantic_duplicates_removed"] = int(semantic_duplicate_indices.size)
             else:
                 df = df_after_exact
                 stats["after_deduplication_rows"] = df.height
@@ -695,73 +858,60 @@ class Pipeline:
                 record_pipeline_stage(6)  # Validation
             if self.progress_tracker:
                 self.progress_tracker.set_stage(6, rows=df.height)
-            validation_base_df = df.clone()
-            if text_column not in validation_base_df.columns:
+            if text_column not in df.columns:
                 raise ValidationError(
                     f"Text column '{text_column}' not found before validation"
                 )
             
-            # Use Polars operations instead of .to_list() to avoid materialization
-            # Process validation in chunks to avoid OOM
-            validation_dropped_chars = 0
-            chunk_size = 100_000  # Process 100K rows at a time
-            
-            # Calculate text lengths using Polars (no materialization)
-            validation_base_df = validation_base_df.with_columns([
-                pl.col(text_column).cast(pl.Utf8).str.strip().str.len_chars().alias("_text_length"),
+            # Compute lengths and the drop predicate with Polars expressions so the
+            # per-row work stays in Rust; only the (small) dropped subset is iterated
+            # below to build audit events.
+            min_length = config.min_length
+            df = df.with_columns([
+                pl.col(text_column).cast(pl.Utf8).str.strip_chars().str.len_chars().alias("_text_length"),
+                pl.col(text_column).cast(pl.Utf8).str.len_chars().alias("_orig_length"),
                 pl.col(text_column).is_null().alias("_is_null")
             ])
-            
-            # Filter rows that fail validation
-            min_length = config.min_length
-            failed_validation = validation_base_df.filter(
-                (pl.col("_is_null") == True) | 
-                (pl.col("_text_length") < min_length) |
-                (pl.col("_text_length") == 0)
+            drop_mask = (
+                pl.col("_is_null")
+                | (pl.col("_text_length") == 0)
+                | (pl.col("_text_length") < min_length)
             )
             
-            # Calculate dropped chars using Polars (no .to_list())
-            if failed_validation.height > 0:
-                validation_dropped_chars = failed_validation.select(
-                    pl.col("_text_length").sum()
-                ).item() or 0
-                
-                # Add audit events (process in chunks)
-                for offset in range(0, failed_validation.height, chunk_size):
-                    chunk = failed_validation.slice(offset, chunk_size)
-                    for row in chunk.iter_rows(named=True):
-                        orig_idx = row["_original_index"]
-                        is_null = row["_is_null"]
-                        text_length = row["_text_length"]
-                        
-                        if is_null:
-                            reason = "Validation: empty_or_null"
-                            details = "len=null"
-                        elif text_length == 0:
-                            reason = "Validation: empty_after_strip"
-                            details = "len=0"
-                        else:
-                            reason = "Validation: below_min_length"
-                            details = f"len={text_length}<{min_length}"
-                        
-                        self.audit_events.append({
-                            "row_index": int(orig_idx),
-                            "reason": reason,
-                            "details": details,
-                        })
-            
-            # Filter out failed validation rows
-            validation_base_df = validation_base_df.filter(
-                (pl.col("_is_null") == False) &
-                (pl.col("_text_length") >= min_length) &
-                (pl.col("_text_length") > 0)
-            )
+            validation_dropped_chars = df.select(
+                pl.col("_orig_length").filter(drop_mask).sum()
+            ).item() or 0
             
-            # Remove temporary columns
-            validation_base_df = validation_base_df.drop(["_text_length", "_is_null"])
+            # Reason/detail strings are built columnar, once per dropped row
+            failed_validation = df.filter(drop_mask).select([
+                pl.col("_original_index"),
+                pl.when(pl.col("_is_null"))
+                .then(pl.lit("Validation: empty_or_null"))
+                .when(pl.col("_text_length") == 0)
+                .then(pl.lit("Validation: empty_after_strip"))
+                .otherwise(pl.lit("Validation: below_min_length"))
+                .alias("_reason"),
+                pl.when(pl.col("_is_null"))
+                .then(pl.lit("len=null"))
+                .otherwise(
+                    pl.format("len={}", pl.col("_text_length"))
+                    + pl.when(pl.col("_text_length") == 0)
+                    .then(pl.lit(""))
+                    .otherwise(pl.lit(f"<{min_length}"))
+                )
+                .alias("_details"),
+            ])
             
-            # Use validation_base_df (already filtered) as final df
-            df = validation_base_df
+            self._add_audit_events(
+                failed_validation["_original_index"],
+                failed_validation["_reason"],
+                failed_validation["_details"]
+            )
+            
+            # Filter out failed validation rows and remove temporary columns
+            df = df.filter(~drop_mask).drop(
+                ["_text_length", "_orig_length", "_is_null"]
+            )
             
             if stage_timer:
                 stage_timer.__exit__(None, None, None)
@@ -776,9 +926,15 @@ class Pipeline:
             if self.memory_profiler:
                 self.memory_profiler.snapshot("before_save")
             if not config.dry_run:
+                # Internal bookkeeping columns are not part of the cleaned dataset
+                output_df = df.drop(
+                    [col for col in ("_original_index", "_text_hash") if col in df.columns]
+                )
+                
                 # Use retry logic for file write operations
+                # (Polars serializes NDJSON natively in Rust, no per-row Python)
                 def write_output():
-                    df.write_ndjson(config.output_path)
+                    output_df.write_ndjson(config.output_path)
                 
                 try:
                     retry_file_operation(
@@ -805,9 +961,11 @@ class Pipeline:
             # STEP 10: Audit log
             if config.audit_log_path:
                 try:
+                    audit_frame = self._audit_frame()
+                    
                     def write_audit_log():
-                        with open(config.audit_log_path, "w", encoding="utf-8") as f:
-                            json.dump(self.audit_events, f, ensure_ascii=False, indent=2)
+                        # JSON array of event objects, serialized by Polars in Rust
+                        audit_frame.write_json(config.audit_log_path, row_oriented=True)
                     
                     retry_file_operation(
                         write_audit_log,
@@ -820,7 +978,7 @@ class Pipeline:
                         )
                     )
                     stats["audit_log_path"] = config.audit_log_path
-                    stats["audit_events"] = len(self.audit_events)
+                    stats["audit_events"] = audit_frame.height
                 except Exception as audit_error:
                     # Don't fail pipeline on audit error
                     logger.warning("audit_log_write_failed", error=str(audit_error))
@@ -168,7 +168,26 @@ def estimate_file_size_mb(file_path: str) -> Optional[float]:
         return None
 
 
-def estimate_lazyframe_memory_mb(lf) -> Optional[float]:
+def parquet_row_count(file_path: str) -> Optional[int]:
+    """
+    Read the row count of a Parquet file from its footer metadata.
+    
+    This is O(1) in the data size - no row groups are read.
+    
+    Args:
+        file_path: Path to a Parquet file
+    
+    Returns:
+        Number of rows, or None if unavailable
+    """
+    try:
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(file_path).metadata.num_rows
+    except Exception:
+        return None
+
+
+def estimate_lazyframe_memory_mb(lf, row_count: Optional[int] = None) -> Optional[float]:
     """
     Estimate memory required to materialize a LazyFrame.
     
@@ -177,6 +196,8 @@ def estimate_lazyframe_memory_mb(lf) -> Optional[float]:
     
     Args:
         lf: Polars LazyFrame to estimate
+        row_count: Known (or upper-bound) row count. If None, rows are counted
+                   by executing the query plan, which may scan the whole input.
     
     Returns:
         Estimated memory in MB, or None if unavailable
@@ -188,11 +209,12 @@ def estimate_lazyframe_memory_mb(lf) -> Optional[float]:
         schema = lf.schema
         
         # Get row count (lazy operation, but may be expensive)
-        try:
-            row_count = lf.select(pl.count()).collect().item()
-        except Exception:
-            # If we can't get row count, return None
-            return None
+        if row_count is None:
+            try:
+                row_count = lf.select(pl.count()).collect().item()
+            except Exception:
+                # If we can't get row count, return None
+                return None
         
         # Estimate memory per row based on schema
         # Rough estimate: sum of column sizes
@@ -239,15 +261,22 @@ def get_available_memory_mb() -> Optional[float]:
 def check_memory_before_materialization(
     lf,
     threshold: float = 0.8,
-    logger=None
+    logger=None,
+    row_count: Optional[int] = None,
+    estimated_mb: Optional[float] = None
 ) -> tuple[bool, Optional[str]]:
     """
     Check if there's enough memory to materialize a LazyFrame.
     
+    Pass row_count or estimated_mb when they are already known to avoid
+    counting rows by executing the query plan.
+    
     Args:
         lf: Polars LazyFrame to check
         threshold: Memory usage threshold (0.8 = 80% of available)
         logger: Optional logger for warnings
+        row_count: Known (or upper-bound) row count of the LazyFrame
+        estimated_mb: Precomputed memory estimate in MB (skips estimation)
     
     Returns:
         Tuple of (has_memory, warning_message)
@@ -256,7 +285,8 @@ def check_memory_before_materialization(
     """
     try:
         # Estimate required memory
-        estimated_mb = estimate_lazyframe_memory_mb(lf)
+        if estimated_mb is None:
+            estimated_mb = estimate_lazyframe_memory_mb(lf, row_count=row_count)
         if estimated_mb is None:
             # Can't estimate, assume OK
             return True, None
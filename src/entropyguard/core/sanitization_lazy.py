@@ -1,69 +1,74 @@
 """
 Lazy sanitization functions for Polars LazyFrame.
 
-Hybrid approach: lazy where possible, chunked materialization for complex ops.
-Implements chunked processing to avoid OOM on large datasets.
+All sanitization steps are expressed in the LazyFrame query plan so Polars can
+execute them with its streaming engine when the pipeline materializes the data.
 """
 
-import polars as pl
+import re
 from typing import Optional
 
+import polars as pl
+
 from entropyguard.core.errors import ProcessingError
-from entropyguard.core.constants import PII_REMOVAL_CHUNK_SIZE
 from entropyguard.sanitization import SanitizationConfig
 
 
-def _apply_pii_removal_to_dataframe(
-    df: pl.DataFrame,
-    text_columns: list[str]
-) -> pl.DataFrame:
+def _is_native_regex(pattern: str) -> bool:
+    """Check whether Polars' (Rust) regex engine can compile a pattern."""
+    try:
+        pl.Series([""], dtype=pl.Utf8).str.replace_all(pattern, "")
+        return True
+    except Exception:
+        return False
+
+
+def _pii_removal_expr(col: str, patterns: dict[str, str]) -> pl.Expr:
     """
-    Apply PII removal to a DataFrame.
+    Build a Polars expression that removes PII from a text column.
     
-    This is a helper function that can be called on chunks.
+    Patterns run as native Polars regex replacements (case-insensitive, same
+    placeholders as remove_pii). A pattern that only Python's re module
+    understands (e.g. look-around) falls back to a per-row re.sub.
     
     Args:
-        df: DataFrame to process
-        text_columns: List of text column names
+        col: Text column name
+        patterns: PII type -> regex pattern
     
     Returns:
-        DataFrame with PII removed
+        Expression replacing the column with its PII-free text
     """
-    from entropyguard.sanitization.core import remove_pii
-    
-    for col in text_columns:
-        if col in df.columns:
-            df = df.with_columns(
-                pl.col(col).cast(pl.Utf8).map_elements(
-                    lambda x: remove_pii(str(x) if x is not None else ""),
-                    return_dtype=pl.Utf8
-                ).alias(col)
+    expr = pl.col(col).cast(pl.Utf8)
+    for pii_type, pattern in patterns.items():
+        placeholder = f"[{pii_type.upper()}_REMOVED]"
+        if _is_native_regex(f"(?i){pattern}"):
+            expr = expr.str.replace_all(f"(?i){pattern}", placeholder, literal=False)
+        else:
+            compiled = re.compile(pattern, flags=re.IGNORECASE)
+            expr = expr.map_elements(
+                lambda x, compiled=compiled, placeholder=placeholder: compiled.sub(placeholder, x),
+                return_dtype=pl.Utf8
             )
-    
-    return df
+    return expr.alias(col)
 
 
 def sanitize_lazyframe(
     lf: pl.LazyFrame,
     config: SanitizationConfig,
-    text_columns: Optional[list[str]] = None,
-    chunk_size: int = PII_REMOVAL_CHUNK_SIZE
+    text_columns: Optional[list[str]] = None
 ) -> pl.LazyFrame:
     """
-    Sanitize a LazyFrame using hybrid approach with chunked processing.
-    
-    Strategy:
-    1. Lazy operations (no materialization): lowercase, strip, drop_nulls
-    2. Complex operations (chunked materialization): PII removal in chunks to avoid OOM
+    Sanitize a LazyFrame without materializing it.
     
-    CRITICAL: For large datasets (>1M rows), PII removal is done in chunks to prevent
-    Out-of-Memory errors. This allows processing of datasets larger than RAM.
+    All steps are added to the query plan: drop_nulls, lowercase/strip and PII
+    removal. Nothing is collected here, so the caller's collect(streaming=True)
+    runs the whole plan batch by batch instead of re-scanning the input for
+    every manually sliced chunk.
     
     Args:
         lf: Input LazyFrame
         config: Sanitization configuration
         text_columns: List of text column names (auto-detected if None)
-        chunk_size: Number of rows to process at a time for PII removal (default: 1M)
     
     Returns:
         Sanitized LazyFrame
@@ -94,66 +99,11 @@ def sanitize_lazyframe(
                     pl.col(col).str.to_lowercase().str.strip_chars().alias(col)
                 )
         
-        # STEP 2: PII removal (requires materialization, but done in chunks)
+        # STEP 2: PII removal (native regex replacements in the lazy plan)
         if config.remove_pii:
-            # CRITICAL: Process in chunks to avoid OOM for large datasets
-            # Strategy:
-            # 1. Get row count (lazy, metadata only)
-            # 2. If dataset is small (< chunk_size), materialize once
-            # 3. If dataset is large, process in chunks and reassemble
-            
-            try:
-                # Get total row count (lazy operation, no materialization)
-                total_rows = lf.select(pl.count()).collect().item()
-            except Exception as count_error:
-                # Handle empty DataFrames or schema errors gracefully
-                error_msg = str(count_error).lower()
-                if "null" in error_msg or "empty" in error_msg or "infer" in error_msg:
-                    # Return original LazyFrame if we can't count (empty/null schema)
-                    return lf
-                raise
-            
-            # If dataset is small, materialize once (faster)
-            if total_rows == 0:
-                return lf
-            elif total_rows <= chunk_size:
-                # Small dataset: materialize once
-                try:
-                    df = lf.collect()
-                    if df.height == 0:
-                        return df.lazy()
-                    
-                    df = _apply_pii_removal_to_dataframe(df, text_columns)
-                    return df.lazy()
-                except Exception as collect_error:
-                    error_msg = str(collect_error).lower()
-                    if "null" in error_msg or "empty" in error_msg or "infer" in error_msg:
-                        return lf
-                    raise
-            else:
-                # Large dataset: process in chunks
-                # This prevents OOM for datasets > RAM size
-                chunks: list[pl.DataFrame] = []
-                
-                # Process in chunks
-                for offset in range(0, total_rows, chunk_size):
-                    # Slice and collect chunk (only this chunk in memory)
-                    chunk_df = lf.slice(offset, chunk_size).collect()
-                    
-                    if chunk_df.height == 0:
-                        continue
-                    
-                    # Apply PII removal to chunk
-                    chunk_df = _apply_pii_removal_to_dataframe(chunk_df, text_columns)
-                    chunks.append(chunk_df)
-                
-                # Reassemble chunks into single DataFrame
-                if chunks:
-                    df = pl.concat(chunks)
-                    return df.lazy()
-                else:
-                    # All chunks were empty
-                    return lf
+            lf = lf.with_columns([
+                _pii_removal_expr(col, config.pii_patterns) for col in text_columns
+            ])
         
         return lf
         
@@ -66,4 +66,7 @@ class PipelineConfig:
     checkpoint_dir: Optional[str] = None  # Directory for checkpoints
     resume: bool = False  # Resume from checkpoint if available
     auto_resume: bool = True  # Automatically resume from checkpoint if available (default: True)
+    semantic_index_type: str = "auto"  # FAISS index: "auto", "flat", "ivfflat", "ivfpq" or "hnsw"
+    semantic_quantization: str = "none"  # Flat index vectors: "none", "fp16", "int8" or "binary"
+    use_gpu: bool = False  # Run FAISS duplicate search on the GPU when one is available
 
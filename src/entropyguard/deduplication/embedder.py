@@ -4,16 +4,19 @@ Embedder class for converting text to vector embeddings.
 Uses sentence-transformers with the all-MiniLM-L6-v2 model for CPU-efficient embeddings.
 """
 
+import importlib.util
+
 import numpy as np
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:
-    SentenceTransformer = None  # type: ignore
+# sentence-transformers pulls in torch and transformers, which take seconds to
+# import. Only check that it is installed here; it is imported when the model
+# is first loaded, so importing the pipeline (e.g. for `entropyguard --help`)
+# stays fast.
+HAS_SENTENCE_TRANSFORMERS = importlib.util.find_spec("sentence_transformers") is not None
 
 
 class Embedder:
@@ -27,23 +30,38 @@ class Embedder:
     - Good quality for semantic similarity
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        batch_size: int = 32,
+        half_precision: bool = False,
+        normalize_embeddings: bool = False,
+    ) -> None:
         """
         Initialize the Embedder.
 
         Args:
             model_name: Name of the sentence-transformers model to use.
                        Default: "all-MiniLM-L6-v2"
+            batch_size: Number of texts per model forward pass. Default: 32
+            half_precision: Run the model in float16 when it is loaded on a GPU.
+                           Ignored on CPU, where float16 matmuls are not faster.
+                           Default: False
+            normalize_embeddings: Return unit-length vectors, so inner products
+                                 are cosine similarities. Default: False
 
         Raises:
             ImportError: If sentence-transformers is not installed
         """
-        if SentenceTransformer is None:
+        if not HAS_SENTENCE_TRANSFORMERS:
             raise ImportError(
                 "sentence-transformers is required. Install with: pip install sentence-transformers"
             )
 
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.half_precision = half_precision
+        self.normalize_embeddings = normalize_embeddings
         self._model: SentenceTransformer | None = None
 
     @property
@@ -55,9 +73,27 @@ class Embedder:
             The SentenceTransformer model instance
         """
         if self._model is None:
+            from sentence_transformers import SentenceTransformer
+
             self._model = SentenceTransformer(self.model_name)
+            if self.half_precision and self._model.device.type == "cuda":
+                self._model.half()
         return self._model
 
+    @property
+    def dimension(self) -> int:
+        """
+        Dimension of the returned embeddings (loads the model on first access).
+
+        Returns:
+            The model's embedding dimension
+        """
+        dimension = self.model.get_sentence_embedding_dimension()
+        if dimension is None:
+            # Some models do not report it; measure it from one embedding
+            dimension = self.embed(["x"]).shape[1]
+        return int(dimension)
+
     def embed(self, texts: list[str]) -> np.ndarray:
         """
         Convert a list of text strings to embedding vectors.
@@ -66,8 +102,9 @@ class Embedder:
             texts: List of text strings to embed
 
         Returns:
-            NumPy array of shape (N, 384) where N is the number of texts.
-            Each row is a 384-dimensional embedding vector (float32).
+            NumPy array of shape (N, dimension) where N is the number of texts
+            (dimension is 384 for all-MiniLM-L6-v2). Each row is a float32
+            embedding vector.
 
         Examples:
             >>> embedder = Embedder()
@@ -77,13 +114,16 @@ class Embedder:
         """
         if not texts:
             # Return empty array with correct dimension
-            return np.empty((0, 384), dtype=np.float32)
+            return np.empty((0, self.dimension), dtype=np.float32)
 
-        # Get embeddings from the model
+        # Get embeddings from the model. encode() already orders texts by length
+        # before batching (and restores the input order), so each forward pass
+        # pads to a similar length and little compute is spent on padding tokens.
         embeddings = self.model.encode(
             texts,
+            batch_size=self.batch_size,
             convert_to_numpy=True,
-            normalize_embeddings=False,  # We'll handle normalization in FAISS if needed
+            normalize_embeddings=self.normalize_embeddings,
             show_progress_bar=False,
         )
 
@@ -91,8 +131,10 @@ class Embedder:
         if not isinstance(embeddings, np.ndarray):
             embeddings = np.array(embeddings)
 
-        # Ensure float32 dtype for FAISS compatibility
-        embeddings = embeddings.astype(np.float32)
+        # Ensure C-contiguous float32 for FAISS compatibility (half-precision models
+        # return float16; this is the only place they are widened). No copy if the
+        # model output already matches.
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
 
         # Ensure 2D shape
         if embeddings.ndim == 1:
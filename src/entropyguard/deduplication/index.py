@@ -2,6 +2,8 @@
 VectorIndex class for FAISS-based similarity search and duplicate detection.
 """
 
+import math
+
 import numpy as np
 from typing import TYPE_CHECKING
 
@@ -14,38 +16,300 @@ except ImportError:
     faiss = None  # type: ignore
 
 
+# Supported FAISS index layouts and metrics
+INDEX_TYPES = ("flat", "ivfflat", "ivfpq", "hnsw")
+METRICS = ("l2", "ip")
+QUANTIZATIONS = ("none", "fp16", "int8", "binary")
+
+# IVF parameters (inverted lists; IVF-PQ adds 8-bit product quantization)
+IVFPQ_MAX_LISTS = 32768
+IVFPQ_MAX_SUBQUANTIZERS = 64
+IVFPQ_NBITS = 8
+IVFPQ_NPROBE = 64
+IVFPQ_MAX_TRAINING_POINTS = 1_572_864
+IVFPQ_MIN_TRAINING_POINTS = 2 ** IVFPQ_NBITS * 39  # Below this, IVF training is unreliable
+
+# HNSW parameters
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+HNSW_DUPLICATE_K = 100  # Neighbors inspected per vector (HNSW has no range search)
+
+# Scalar/binary quantization parameters
+SQ_MAX_TRAINING_POINTS = 100_000
+BINARY_HAMMING_SLACK = 1.5  # Widen the Hamming radius so candidate recall stays high
+
+# GPU parameters (FAISS GPU indexes have no range search; k is capped at 2048)
+GPU_DUPLICATE_K = 1024
+
+# Shared FAISS GPU resources (allocated once per process on first use)
+_gpu_resources = None
+
+
+def gpu_available() -> bool:
+    """Return True if FAISS was built with GPU support and a GPU is visible."""
+    return (
+        faiss is not None
+        and hasattr(faiss, "get_num_gpus")
+        and faiss.get_num_gpus() > 0
+    )
+
+
+def _get_gpu_resources() -> "faiss.StandardGpuResources":
+    """Return the process-wide FAISS GPU resources, creating them on first use."""
+    global _gpu_resources
+    if _gpu_resources is None:
+        _gpu_resources = faiss.StandardGpuResources()
+    return _gpu_resources
+
+
 class VectorIndex:
     """
     FAISS-based vector index for similarity search and duplicate detection.
 
-    Uses IndexFlatL2 (Euclidean distance) for MVP. This is:
-    - Simple and reliable
-    - Exact search (no approximation)
-    - Good for small to medium datasets
-    - CPU-friendly
+    Supported index types:
+    - "flat": IndexFlatL2, exact brute-force search (default, good for small datasets)
+    - "ivfflat": IndexIVFFlat, inverted lists over full float32 vectors. Sublinear
+      search with exact distances within the probed lists; trained on the stored
+      vectors the first time the index is queried.
+    - "ivfpq": IndexIVFPQ, inverted lists with product-quantized codes. Sublinear
+      search and ~8x smaller memory footprint; trained on the stored vectors the
+      first time the index is queried.
+    - "hnsw": IndexHNSWFlat, graph-based approximate search with ~log(N) queries.
+
+    Supported metrics:
+    - "l2": Euclidean distance (default); duplicate thresholds are maximum distances.
+    - "ip": Inner product; for unit-length vectors this is cosine similarity, so
+      duplicate thresholds are minimum similarities and no distance conversion is needed.
+
+    Supported quantizations (flat index only):
+    - "none": float32 vectors (default)
+    - "fp16": IndexScalarQuantizer(QT_fp16), half the index memory; no training
+      needed and practically lossless for sentence embeddings
+    - "int8": IndexScalarQuantizer(QT_8bit), 4x less index memory and bandwidth
+    - "binary": sign bits in an IndexBinaryFlat, 32x smaller. Hamming search only
+      generates candidates; duplicates are confirmed against the float32 vectors.
+
+    With use_gpu=True and a GPU available, find_duplicates() copies flat and IVF
+    indexes to the GPU for the duplicate search and releases them afterwards.
+    Only IVF-PQ is stored in float16 there.
     """
 
-    def __init__(self, dimension: int = 384) -> None:
+    def __init__(
+        self,
+        dimension: int = 384,
+        index_type: str = "flat",
+        metric: str = "l2",
+        quantization: str = "none",
+        use_gpu: bool = False,
+        trained_index: "faiss.Index | None" = None,
+    ) -> None:
         """
         Initialize the VectorIndex.
 
         Args:
             dimension: Dimension of the vectors (default: 384 for all-MiniLM-L6-v2)
+            index_type: One of "flat", "ivfflat", "ivfpq", "hnsw" (default: "flat")
+            metric: "l2" (Euclidean distance) or "ip" (inner product) (default: "l2")
+            quantization: One of "none", "fp16", "int8", "binary" (default: "none")
+            use_gpu: Run duplicate search on the GPU when one is available (default: False)
+            trained_index: An already-trained, empty IVF index (see the trained_index
+                          attribute of a previous VectorIndex) to reuse instead of
+                          training a new one. Ignored unless its type, dimension and
+                          metric match this index, and when it was trained with a
+                          different number of lists than this index's input size
+                          calls for (default: None)
 
         Raises:
             ImportError: If faiss-cpu is not installed
+            ValueError: If index_type, metric or quantization is not supported
         """
         if faiss is None:
             raise ImportError(
                 "faiss-cpu is required. Install with: pip install faiss-cpu"
             )
 
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"Unsupported index_type: {index_type!r}. Expected one of {INDEX_TYPES}"
+            )
+
+        if metric not in METRICS:
+            raise ValueError(f"Unsupported metric: {metric!r}. Expected one of {METRICS}")
+
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(
+                f"Unsupported quantization: {quantization!r}. Expected one of {QUANTIZATIONS}"
+            )
+
+        if quantization != "none" and index_type != "flat":
+            raise ValueError("quantization is only supported with index_type='flat'")
+
+        if quantization == "binary" and dimension % 8 != 0:
+            raise ValueError(
+                f"Binary quantization requires a dimension divisible by 8, got {dimension}"
+            )
+
         self.dimension = dimension
-        self._index: faiss.IndexFlatL2 = faiss.IndexFlatL2(dimension)
+        self.index_type = index_type
+        self.metric = metric
+        self.quantization = quantization
+        # HNSW and quantized flat indexes have no FAISS GPU counterpart
+        self.use_gpu = (
+            use_gpu
+            and index_type != "hnsw"
+            and quantization == "none"
+            and gpu_available()
+        )
+        # Trained/quantized indexes need the vectors up front, so they are built
+        # lazily on first query
+        self._index: "faiss.Index | None" = (
+            None
+            if index_type in ("ivfflat", "ivfpq") or quantization != "none"
+            else self._create_index(index_type)
+        )
+        # Trained (empty) IVF index, reusable by later VectorIndex instances so
+        # repeated runs skip the k-means/PQ training step
+        self.trained_index: "faiss.Index | None" = (
+            trained_index
+            if trained_index is not None and self._is_reusable_trained_index(trained_index)
+            else None
+        )
         self._vector_count = 0
-        # Store vectors for duplicate detection
+        # Store vectors for duplicate detection, one float32 block per add_vectors() call
         self._vectors: list[np.ndarray] = []
 
+    @property
+    def _faiss_metric(self) -> int:
+        """FAISS metric constant for this index."""
+        return faiss.METRIC_INNER_PRODUCT if self.metric == "ip" else faiss.METRIC_L2
+
+    def _create_flat_index(self) -> "faiss.Index":
+        """Create an exact brute-force index for this metric."""
+        if self.metric == "ip":
+            return faiss.IndexFlatIP(self.dimension)
+        return faiss.IndexFlatL2(self.dimension)
+
+    def _create_index(self, index_type: str) -> "faiss.Index":
+        """Create an empty FAISS index of the given (untrained) type."""
+        if index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(self.dimension, HNSW_M, self._faiss_metric)
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+            return index
+        return self._create_flat_index()
+
+    def _is_reusable_trained_index(self, index: "faiss.Index") -> bool:
+        """Return True if a trained index has this index's IVF type, dimension and metric."""
+        if self.index_type == "ivfflat":
+            expected = faiss.IndexIVFFlat
+        elif self.index_type == "ivfpq":
+            expected = faiss.IndexIVFPQ
+        else:
+            return False
+        return (
+            isinstance(index, expected)
+            and index.is_trained
+            and index.d == self.dimension
+            and index.metric_type == self._faiss_metric
+        )
+
+    def _build_ivf_index(self, vectors: np.ndarray) -> "faiss.Index":
+        """
+        Train an IndexIVFFlat or IndexIVFPQ on (a sample of) the stored vectors.
+
+        Falls back to an exact flat index when there are too few vectors to
+        train the coarse (and product) quantizer reliably. If a trained index
+        with the list count for this input size is available (trained_index),
+        an empty copy of it is used and training is skipped.
+        """
+        n = vectors.shape[0]
+        if n < IVFPQ_MIN_TRAINING_POINTS:
+            return self._create_flat_index()
+
+        nlist = min(4 * int(math.sqrt(n)), IVFPQ_MAX_LISTS)
+        # Centroids trained for a much smaller or larger input would quietly
+        # lower recall, so only a template sized for this input is reused
+        if self.trained_index is not None and self.trained_index.nlist == nlist:
+            index = faiss.clone_index(self.trained_index)
+            index.reset()
+            index.nprobe = IVFPQ_NPROBE
+            return index
+
+        quantizer = self._create_flat_index()
+        if self.index_type == "ivfflat":
+            index = faiss.IndexIVFFlat(
+                quantizer, self.dimension, nlist, self._faiss_metric
+            )
+        else:
+            # Number of sub-quantizers must divide the dimension
+            m = max(
+                d for d in range(1, IVFPQ_MAX_SUBQUANTIZERS + 1) if self.dimension % d == 0
+            )
+            index = faiss.IndexIVFPQ(
+                quantizer, self.dimension, nlist, m, IVFPQ_NBITS, self._faiss_metric
+            )
+
+        if n > IVFPQ_MAX_TRAINING_POINTS:
+            sample = np.random.choice(n, IVFPQ_MAX_TRAINING_POINTS, replace=False)
+            index.train(vectors[sample])
+        else:
+            index.train(vectors)
+        index.nprobe = IVFPQ_NPROBE
+        # Keep an empty trained copy before vectors are added to it
+        self.trained_index = faiss.clone_index(index)
+        return index
+
+    def _build_quantized_index(self, vectors: np.ndarray) -> "faiss.Index":
+        """Build an fp16/int8 scalar-quantized or binary flat index."""
+        if self.quantization == "binary":
+            return faiss.IndexBinaryFlat(self.dimension)
+
+        if self.quantization == "fp16":
+            # Half floats need no per-dimension range, so there is nothing to train
+            return faiss.IndexScalarQuantizer(
+                self.dimension, faiss.ScalarQuantizer.QT_fp16, self._faiss_metric
+            )
+
+        index = faiss.IndexScalarQuantizer(
+            self.dimension, faiss.ScalarQuantizer.QT_8bit, self._faiss_metric
+        )
+        n = vectors.shape[0]
+        if n > SQ_MAX_TRAINING_POINTS:
+            sample = np.random.choice(n, SQ_MAX_TRAINING_POINTS, replace=False)
+            index.train(vectors[sample])
+        else:
+            index.train(vectors)
+        return index
+
+    def _encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Convert float32 vectors to the representation stored in the index."""
+        if self.quantization == "binary":
+            return np.packbits(vectors > 0, axis=1)
+        return vectors
+
+    def _stored_vectors(self) -> np.ndarray:
+        """
+        Return all stored vectors as one contiguous float32 array.
+
+        The per-batch blocks are merged once and replaced by the merged array, so
+        repeated calls (training, then duplicate search) don't copy them again.
+        """
+        if len(self._vectors) > 1:
+            self._vectors = [np.vstack(self._vectors)]
+        return self._vectors[0]
+
+    def _ensure_index(self) -> "faiss.Index":
+        """Return the FAISS index, training and filling it first if needed."""
+        if self._index is None:
+            vectors = self._stored_vectors()
+            if self.quantization != "none":
+                self._index = self._build_quantized_index(vectors)
+            else:
+                self._index = self._build_ivf_index(vectors)
+            self._index.add(self._encode(vectors))
+        return self._index
+
     def size(self) -> int:
         """
         Get the number of vectors in the index.
@@ -78,17 +342,17 @@ class VectorIndex:
                 f"Vector dimension mismatch: expected {self.dimension}, got {vectors.shape[1]}"
             )
 
-        # Convert to float32 if needed
-        if vectors.dtype != np.float32:
-            vectors = vectors.astype(np.float32)
+        # One contiguous float32 copy of the batch (also converts the dtype if
+        # needed), so the caller may reuse its buffer
+        vectors = np.array(vectors, dtype=np.float32, order="C", copy=True)
 
-        # Add to FAISS index
-        self._index.add(vectors)
+        # Add to FAISS index (deferred until training for IVF-PQ / quantized indexes)
+        if self._index is not None:
+            self._index.add(self._encode(vectors))
         self._vector_count += vectors.shape[0]
 
         # Store vectors for duplicate detection
-        for i in range(vectors.shape[0]):
-            self._vectors.append(vectors[i].copy())
+        self._vectors.append(vectors)
 
     def search(
         self, query_vector: np.ndarray, k: int = 10
@@ -104,6 +368,7 @@ class VectorIndex:
             Tuple of (distances, indices):
             - distances: List of lists, where each inner list contains distances to k nearest neighbors
             - indices: List of lists, where each inner list contains indices of k nearest neighbors
+            With quantization="binary", distances are Hamming distances between sign codes.
 
         Raises:
             ValueError: If index is empty or query has wrong shape
@@ -120,15 +385,14 @@ class VectorIndex:
                 f"Query dimension mismatch: expected {self.dimension}, got {query_vector.shape[1]}"
             )
 
-        # Convert to float32 if needed
-        if query_vector.dtype != np.float32:
-            query_vector = query_vector.astype(np.float32)
+        # FAISS needs a C-contiguous float32 matrix (no copy if already one)
+        query_vector = np.ascontiguousarray(query_vector, dtype=np.float32)
 
         # Limit k to available vectors
         k = min(k, self._vector_count)
 
         # Search
-        distances, indices = self._index.search(query_vector, k)
+        distances, indices = self._ensure_index().search(self._encode(query_vector), k)
 
         # Convert to lists for easier use
         distances_list = [dist.tolist() for dist in distances]
@@ -140,118 +404,193 @@ class VectorIndex:
         """
         Find duplicate vectors based on distance threshold.
 
-        Uses L2 (Euclidean) distance. Vectors with distance <= threshold are considered duplicates.
+        With metric="l2", vectors with distance <= threshold are considered duplicates.
+        With metric="ip", vectors with inner product >= threshold are considered
+        duplicates (cosine similarity for unit-length vectors).
 
         Args:
-            threshold: Maximum distance for vectors to be considered duplicates.
+            threshold: For "l2", maximum distance for vectors to be considered duplicates.
                       Lower values = stricter (fewer duplicates found).
                       Typical range: 0.1-0.5 for normalized embeddings.
+                      For "ip", minimum similarity (e.g. 0.95); higher values = stricter.
 
         Returns:
             List of sets, where each set contains indices of duplicate vectors.
             Each vector appears in at most one set.
 
         Note:
-            This uses a simple clustering approach: for each vector, find all neighbors
-            within threshold distance and group them together.
+            All stored vectors are queried in a single batched call: a range search
+            for "flat", "ivfflat" and "ivfpq" indexes, and a k-NN search (k=HNSW_DUPLICATE_K)
+            for "hnsw", which does not support range queries. On the GPU a k-NN
+            search with k=GPU_DUPLICATE_K is used instead. Neighbor pairs are
+            then grouped with union-find.
         """
         if self._vector_count == 0:
             return []
 
-        # Get all vectors from index (FAISS doesn't provide direct access, so we search)
-        # We'll use a more efficient approach: for each vector, find its neighbors
-        duplicate_groups: list[set[int]] = []
-        processed: set[int] = set()
-
-        # For each vector, find its neighbors within threshold
-        for i in range(self._vector_count):
-            if i in processed:
-                continue
-
-            # Get the vector by searching for itself (with a small epsilon)
-            # Actually, we need to reconstruct or use a different approach
-            # For now, we'll search with a large k and filter by threshold
-            try:
-                # Create a dummy query - we'll need to store vectors separately for this
-                # For MVP, we'll use a simpler approach: search all against all
-                # This is O(n^2) but acceptable for MVP
-                pass
-            except Exception:
-                pass
-
-        # Simpler approach: use the index's search capability
-        # We need to store vectors to query them. For MVP, let's use a workaround:
-        # We'll search each vector against all others by using the index's search
-
-        # Actually, FAISS IndexFlatL2 doesn't let us retrieve vectors easily.
-        # For MVP, we'll implement a simpler version that requires storing vectors.
-        # But that's not ideal. Let me implement a basic version that works:
-
-        # For now, return empty list - this will be improved in next iteration
-        # The proper implementation would require storing vectors separately
-        # or using a different FAISS index type that supports vector retrieval
-
-        # Basic implementation: search each vector against all others
-        # This requires us to have access to the vectors, which we don't store
-        # For MVP, we'll implement a version that the user must provide vectors for
-
-        # Actually, let's implement a working version using a stored vectors approach
-        # But that requires changing the API. For now, let's document the limitation
-        # and provide a basic implementation that works with the current API
-
-        # Since we can't retrieve vectors from FAISS IndexFlatL2 easily,
-        # we'll need to modify the class to store vectors. Let's do that:
         return self._find_duplicates_with_stored_vectors(threshold)
 
-    def _find_duplicates_with_stored_vectors(
-        self, threshold: float
-    ) -> list[set[int]]:
+    def _neighbor_pairs(
+        self, vectors: np.ndarray, radius: float
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Internal method to find duplicates using stored vectors.
+        Return (query, neighbor) index pairs within the search radius.
 
-        Uses a union-find approach to group vectors within threshold distance.
+        The radius is a squared L2 distance for "l2" and a minimum inner product
+        for "ip". Self-matches are excluded.
         """
-        if len(self._vectors) == 0:
-            return []
+        index = self._ensure_index()
+        n = vectors.shape[0]
+        is_ip = self.metric == "ip"
+
+        if self.quantization == "binary":
+            queries, neighbors = self._binary_candidate_pairs(index, vectors, radius)
+        elif self.index_type == "hnsw" or self.use_gpu:
+            if self.use_gpu:
+                options = faiss.GpuClonerOptions()
+                # Only IVF-PQ needs float16 (its lookup tables with many sub-quantizers);
+                # its candidates are confirmed in float32 below. Flat and IVF-Flat
+                # indexes keep exact float32 distances on the GPU.
+                options.useFloat16 = self.index_type == "ivfpq"
+                index = faiss.index_cpu_to_gpu(_get_gpu_resources(), 0, index, options)
+                k = min(GPU_DUPLICATE_K, n)
+            else:
+                k = min(HNSW_DUPLICATE_K, n)
+            # One contiguous query matrix -> a single host-to-device copy on the GPU
+            distances, indices = index.search(np.ascontiguousarray(vectors), k)
+            # Release the GPU copy of the index; the CPU index remains authoritative
+            del index
+            within = distances >= radius if is_ip else distances <= radius
+            mask = (indices >= 0) & within
+            queries = np.broadcast_to(np.arange(n)[:, None], indices.shape)[mask]
+            neighbors = indices[mask]
+        else:
+            # FAISS range search is exclusive (distance < radius for L2, similarity
+            # > radius for IP); nudge the radius so boundary values still count.
+            direction = np.float32(-np.inf) if is_ip else np.float32(np.inf)
+            search_radius = float(np.nextafter(np.float32(radius), direction))
+            lims, _, neighbors = index.range_search(vectors, search_radius)
+            queries = np.repeat(np.arange(n), np.diff(lims).astype(np.int64))
+
+        # Sign-bit and PQ codes only approximate the metric: confirm candidates
+        # with the exact float32 metric so no pair below threshold is merged
+        if self.quantization == "binary" or self.index_type == "ivfpq":
+            queries, neighbors = self._confirm_pairs(vectors, queries, neighbors, radius)
+
+        not_self = queries != neighbors
+        return queries[not_self], neighbors[not_self]
+
+    def _confirm_pairs(
+        self,
+        vectors: np.ndarray,
+        queries: np.ndarray,
+        neighbors: np.ndarray,
+        radius: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Keep only the candidate pairs within the radius under the exact metric."""
+        if self.metric == "ip":
+            scores = np.einsum("ij,ij->i", vectors[queries], vectors[neighbors])
+            confirmed = scores >= radius
+        else:
+            diff = vectors[queries] - vectors[neighbors]
+            confirmed = np.einsum("ij,ij->i", diff, diff) <= radius
+        return queries[confirmed], neighbors[confirmed]
+
+    def _binary_candidate_pairs(
+        self, index: "faiss.IndexBinaryFlat", vectors: np.ndarray, radius: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate candidate pairs by Hamming distance between sign-bit codes.
+
+        For unit-length vectors at angle theta, the expected fraction of differing
+        sign bits is theta / pi, so the cosine threshold is mapped to a Hamming
+        radius (widened by BINARY_HAMMING_SLACK to preserve recall).
+        """
+        # Convert the radius to a cosine threshold (squared L2 for unit vectors)
+        cos_threshold = radius if self.metric == "ip" else 1.0 - radius / 2.0
+        angle = math.acos(min(1.0, max(-1.0, cos_threshold)))
+        hamming_radius = int(
+            math.ceil(self.dimension * angle / math.pi * BINARY_HAMMING_SLACK)
+        ) + 1
+
+        lims, _, neighbors = index.range_search(self._encode(vectors), hamming_radius)
+        queries = np.repeat(np.arange(vectors.shape[0]), np.diff(lims).astype(np.int64))
+        return queries, neighbors
+
+    def find_duplicate_labels(self, threshold: float) -> np.ndarray:
+        """
+        Label every stored vector with the lowest index in its duplicate group.
 
-        # Convert threshold to squared distance (L2 distance squared)
-        threshold_squared = threshold * threshold
+        Args:
+            threshold: Same meaning as in find_duplicates().
 
-        # Union-Find data structure for grouping
-        parent = list(range(len(self._vectors)))
+        Returns:
+            int64 array of shape (N,). labels[i] == i for vectors that are unique or
+            the first member of their group; otherwise labels[i] is that first member.
+        """
+        if self._vector_count == 0:
+            return np.empty(0, dtype=np.int64)
 
-        def find(x: int) -> int:
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
+        # L2 indexes report squared distances; inner products are used as-is
+        radius = threshold if self.metric == "ip" else threshold * threshold
 
-        def union(x: int, y: int) -> None:
-            root_x = find(x)
-            root_y = find(y)
-            if root_x != root_y:
-                parent[root_y] = root_x
+        queries, neighbors = self._neighbor_pairs(self._stored_vectors(), radius)
+        return _component_labels(self._vector_count, queries, neighbors)
 
-        # For each vector, find all neighbors within threshold
-        for i in range(len(self._vectors)):
-            # Search for neighbors of vector i
-            query = self._vectors[i].reshape(1, -1).astype(np.float32)
-            distances, indices = self._index.search(query, k=len(self._vectors))
+    def _find_duplicates_with_stored_vectors(
+        self, threshold: float
+    ) -> list[set[int]]:
+        """
+        Internal method to find duplicates using stored vectors.
 
-            # Group vectors that are within threshold
-            for dist, idx in zip(distances[0], indices[0]):
-                if dist <= threshold_squared and idx != i:
-                    union(i, idx)
+        Groups vectors by their connected-component label (see _component_labels).
+        """
+        labels = self.find_duplicate_labels(threshold)
+        members = np.flatnonzero(labels != np.arange(labels.size))
+        if members.size == 0:
+            return []
 
-        # Group indices by their root
-        groups: dict[int, set[int]] = {}
-        for i in range(len(self._vectors)):
-            root = find(i)
-            if root not in groups:
-                groups[root] = set()
-            groups[root].add(i)
+        # Every group is its label (first member) plus the members pointing at it
+        members = members[np.argsort(labels[members], kind="stable")]
+        roots, starts = np.unique(labels[members], return_index=True)
+        return [
+            {root, *group}
+            for root, group in zip(
+                roots.tolist(), np.split(members, starts[1:])
+            )
+        ]
 
-        # Return groups with more than one element (actual duplicates)
-        duplicate_groups = [group for group in groups.values() if len(group) > 1]
 
-        return duplicate_groups
+def _component_labels(
+    n: int, queries: np.ndarray, neighbors: np.ndarray
+) -> np.ndarray:
+    """
+    Connected components of the neighbor graph as a vectorized union-find.
 
+    Each round hooks both endpoints of every pair onto the smaller of their labels
+    (np.minimum.at) and then compresses paths by pointer jumping (labels[labels]).
+    Labels only ever decrease to an index in the same component, so at the fixed
+    point every vector is labelled with the lowest index in its component.
+    """
+    labels = np.arange(n, dtype=np.int64)
+    if queries.size == 0:
+        return labels
+
+    queries = queries.astype(np.int64, copy=False)
+    neighbors = neighbors.astype(np.int64, copy=False)
+    while True:
+        hooked = labels.copy()
+        pair_min = np.minimum(labels[queries], labels[neighbors])
+        np.minimum.at(hooked, queries, pair_min)
+        np.minimum.at(hooked, neighbors, pair_min)
+        # Hook the old roots too, so whole trees move in one round
+        np.minimum.at(hooked, labels, hooked)
+
+        jumped = hooked[hooked]
+        while not np.array_equal(jumped, hooked):
+            hooked = jumped
+            jumped = hooked[hooked]
+
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
@@ -10,6 +10,7 @@ materialize the data with `.collect()` or use streaming sinks.
 """
 
 import os
+import stat
 import tempfile
 from pathlib import Path
 from typing import Optional
@@ -86,7 +87,9 @@ def validate_input_file(file_path: str, max_size_gb: float = 100.0) -> tuple[boo
     - File is not empty (for files)
     - File size is reasonable (warns if > max_size_gb)
     - File is readable
-    - Format detection matches extension
+    
+    The path is stat'ed once; format detection is left to load_dataset(), which
+    only sniffs magic numbers when the extension is ambiguous.
     
     For directories: checks if it's a valid PDF directory.
     
@@ -101,12 +104,16 @@ def validate_input_file(file_path: str, max_size_gb: float = 100.0) -> tuple[boo
     """
     path = Path(file_path)
     
-    # Check path exists
-    if not path.exists():
+    # Check path exists (a single stat() call also answers the checks below)
+    try:
+        path_stat = path.stat()
+    except FileNotFoundError:
         return False, f"Path not found: {file_path}"
+    except OSError as e:
+        return False, f"Cannot access file: {file_path} ({str(e)})"
     
     # Handle directories (PDF support)
-    if path.is_dir():
+    if stat.S_ISDIR(path_stat.st_mode):
         # Check if it's a PDF directory
         if _is_pdf_directory(path):
             # Check if PDF support is available
@@ -130,44 +137,22 @@ def validate_input_file(file_path: str, max_size_gb: float = 100.0) -> tuple[boo
             )
     
     # Check file size
-    try:
-        file_size = path.stat().st_size
-        if file_size == 0:
-            return False, f"File is empty: {file_path}"
-        
-        file_size_gb = file_size / (1024 ** 3)
-        if file_size_gb > max_size_gb:
-            return False, (
-                f"File is very large ({file_size_gb:.1f}GB). "
-                f"Consider using --checkpoint-dir for large files. "
-                f"Maximum recommended size: {max_size_gb}GB"
-            )
-    except OSError as e:
-        return False, f"Cannot access file: {file_path} ({str(e)})"
+    file_size = path_stat.st_size
+    if file_size == 0:
+        return False, f"File is empty: {file_path}"
+    
+    file_size_gb = file_size / (1024 ** 3)
+    if file_size_gb > max_size_gb:
+        return False, (
+            f"File is very large ({file_size_gb:.1f}GB). "
+            f"Consider using --checkpoint-dir for large files. "
+            f"Maximum recommended size: {max_size_gb}GB"
+        )
     
     # Check file is readable
     if not os.access(file_path, os.R_OK):
         return False, f"File is not readable: {file_path}. Check file permissions."
     
-    # Check format detection matches extension
-    suffix = path.suffix.lower()
-    detected_format = _detect_file_format(file_path)
-    
-    # Warn if format mismatch (but don't fail - let load_dataset handle it)
-    if detected_format != 'unknown':
-        expected_formats = {
-            '.csv': 'csv',
-            '.ndjson': 'ndjson',
-            '.jsonl': 'ndjson',
-            '.json': 'ndjson',
-            '.parquet': 'parquet',
-            '.xlsx': 'xlsx'
-        }
-        expected_format = expected_formats.get(suffix)
-        if expected_format and detected_format != expected_format:
-            # This is a warning, not an error - format detection might be wrong
-            pass
-    
     return True, None
 
 
@@ -7,10 +7,13 @@ API_BASE_URL = "http://localhost:8000"
 API_TOKEN_URL = f"{API_BASE_URL}/auth/token"
 API_AUDIT_URL = f"{API_BASE_URL}/api/v1/telemetry/audit"
 
+# One session for all requests, so the TCP (and TLS) connection is reused
+session = requests.Session()
+
 # Login
 print("[LOGIN] Logging in...")
 form_data = {'username': 'admin', 'password': 'admin'}
-response = requests.post(API_TOKEN_URL, data=form_data, headers={'Content-Type': 'application/x-www-form-urlencoded'})
+response = session.post(API_TOKEN_URL, data=form_data)
 
 if response.status_code != 200:
     print(f"[ERROR] Login failed: {response.status_code}")
@@ -19,10 +22,8 @@ if response.status_code != 200:
 token = response.json()['access_token']
 print("[OK] Logged in successfully!")
 
-headers = {
-    'Content-Type': 'application/json',
-    'Authorization': f'Bearer {token}'
-}
+# json= sets Content-Type per request; only the auth header is shared
+session.headers.update({'Authorization': f'Bearer {token}'})
 
 # Send 5 critical logs from payment-gateway
 print("\n[SENDING] Sending 5 critical logs from payment-gateway...")
@@ -41,10 +42,9 @@ for i in range(5):
         }
     }
     
-    response = requests.post(
+    response = session.post(
         API_AUDIT_URL,
         json={"data": entry},
-        headers=headers
     )
     
     if response.status_code in [200, 201]:
@@ -55,6 +55,8 @@ for i in range(5):
     
     time.sleep(0.5)  # Small delay between requests
 
+session.close()
+
 print("\n[OK] Test completed! Check the Alerts page in the dashboard.")
 print("   Expected: Alert should be triggered if rule threshold is <= 5")
 
@@ -60,6 +60,9 @@ def test_checkpoint_manager_save_and_load():
         
         assert checkpoint_path is not None
         assert Path(checkpoint_path).exists()
+        # Checkpoints are columnar Parquet files, readable without the manager
+        assert checkpoint_path.endswith(".parquet")
+        assert pl.read_parquet(checkpoint_path).equals(df)
         
         # Load checkpoint
         loaded_df = manager.load_checkpoint(
@@ -106,6 +109,28 @@ def test_checkpoint_validation_fails_on_different_input():
         assert result is None
 
 
+def test_checkpoint_validation_fails_on_modified_input():
+    """Test that checkpoint validation fails if the same input file was modified."""
+    import os
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = CheckpointManager(checkpoint_dir=tmpdir)
+        
+        test_file = Path(tmpdir) / "test.jsonl"
+        test_file.write_text('{"text": "original"}\n')
+        config = {"input_path": str(test_file)}
+        
+        manager.save_checkpoint("after_exact_dedup", pl.DataFrame({"text": ["test"]}), str(test_file), config)
+        
+        # Same path and size, different content and modification time
+        test_file.write_text('{"text": "modified"}\n')
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        result = manager.load_checkpoint("after_exact_dedup", str(test_file), config)
+        assert result is None
+
+
 def test_checkpoint_validation_fails_on_different_config():
     """Test that checkpoint validation fails if config changed."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -152,8 +177,6 @@ def test_find_latest_checkpoint():
         
         # Save multiple checkpoints
         manager.save_checkpoint("after_exact_dedup", df, str(test_file), config)
-        import time
-        time.sleep(0.1)  # Ensure different timestamps
         manager.save_checkpoint("after_semantic_dedup", df, str(test_file), config)
         
         # Find latest
@@ -200,8 +223,6 @@ def test_cleanup_checkpoints_keep_latest():
         
         # Save multiple checkpoints
         manager.save_checkpoint("after_exact_dedup", df, str(test_file), config)
-        import time
-        time.sleep(0.1)
         manager.save_checkpoint("after_semantic_dedup", df, str(test_file), config)
         
         # Cleanup keeping latest
@@ -154,10 +154,9 @@ def test_cli_argument_parsing():
     import sys
     
     # Test --version
-    with patch('sys.argv', ['entropyguard', '--version']):
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-        assert exc_info.value.code == 0
+    with pytest.raises(SystemExit) as exc_info:
+        main(['--version'])
+    assert exc_info.value.code == 0
 
 
 def test_cli_json_output():
@@ -233,9 +232,8 @@ def test_cli_help():
     from entropyguard.cli.main import main
     import sys
     
-    with patch('sys.argv', ['entropyguard', '--help']):
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-        assert exc_info.value.code == 0
+    with pytest.raises(SystemExit) as exc_info:
+        main(['--help'])
+    assert exc_info.value.code == 0
 
 
@@ -6,8 +6,10 @@ Tests the refactored pipeline with structured errors and batched embeddings.
 
 import json
 import tempfile
+import zlib
 from pathlib import Path
 
+import numpy as np
 import pytest
 import polars as pl
 
@@ -49,6 +51,30 @@ def output_file():
         Path(temp_path).unlink()
 
 
+@pytest.fixture
+def counting_embedder():
+    """Create a stub embedder that records every text it embeds."""
+    class CountingEmbedder:
+        dimension = 8
+        
+        def __init__(self):
+            self.embedded: list[str] = []
+        
+        def embed(self, texts):
+            self.embedded.extend(texts)
+            # Deterministic unit vector per text, so no model download is needed
+            vectors = np.array(
+                [
+                    np.random.default_rng(zlib.crc32(text.encode())).standard_normal(self.dimension)
+                    for text in texts
+                ],
+                dtype=np.float32,
+            ).reshape(len(texts), self.dimension)
+            return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    
+    return CountingEmbedder()
+
+
 def test_pipeline_raises_validation_error_missing_file():
     """Test that pipeline raises ValidationError for missing input file."""
     config = PipelineConfig(
@@ -224,3 +250,210 @@ def test_pipeline_quiet_mode():
     
     assert config.show_progress is False
 
+
+@pytest.mark.parametrize("threshold, runs_stage2", [(0.5, True), (1.0, False)])
+def test_pipeline_semantic_dedup_depends_on_threshold(
+    sample_data_file, output_file, counting_embedder, threshold, runs_stage2
+):
+    """Test that Stage 2 runs below a dedup_threshold of 1.0 and is skipped at 1.0."""
+    config = PipelineConfig(
+        input_path=sample_data_file,
+        output_path=output_file,
+        text_column="text",
+        min_length=1,
+        dedup_threshold=threshold,
+        show_progress=False
+    )
+    
+    pipeline = Pipeline()
+    pipeline.embedder = counting_embedder
+    result = pipeline.run(config)
+    
+    assert result["success"] is True
+    # The FAISS index is only built when Stage 2 runs
+    assert (pipeline.index is not None) is runs_stage2
+    assert bool(counting_embedder.embedded) is runs_stage2
+    if not runs_stage2:
+        assert result["stats"]["semantic_duplicates_removed"] == 0
+
+
+def test_pipeline_embedding_cache_reuses_vectors(counting_embedder):
+    """Test that cached embeddings are reused instead of re-embedding texts."""
+    pipeline = Pipeline(embed_cache_size=10)
+    pipeline.embedder = counting_embedder
+    
+    first = pipeline._embed_with_cache(["a", "b"], ["h1", "h2"])
+    second = pipeline._embed_with_cache(["a", "c"], ["h1", "h3"])
+    
+    assert first.shape == (2, counting_embedder.dimension)
+    assert second.shape == (2, counting_embedder.dimension)
+    np.testing.assert_array_equal(first[0], second[0])
+    # "a" should only have been embedded once
+    assert counting_embedder.embedded == ["a", "b", "c"]
+
+
+def test_pipeline_embedding_cache_disabled_by_default(counting_embedder):
+    """Test that a default Pipeline keeps no embeddings between calls."""
+    pipeline = Pipeline()
+    pipeline.embedder = counting_embedder
+    
+    pipeline._embed_with_cache(["a", "b"], ["h1", "h2"])
+    pipeline._embed_with_cache(["a", "c"], ["h1", "h3"])
+    
+    assert counting_embedder.embedded == ["a", "b", "a", "c"]
+    assert len(pipeline._embed_cache) == 0
+
+
+def test_pipeline_embedding_cache_across_runs(output_file, tmp_path, counting_embedder):
+    """Test that run() reuses cached embeddings only for the exact same text."""
+    first_input = tmp_path / "first.jsonl"
+    first_input.write_text(
+        '{"text": "Hello World, this is a test."}\n'
+        '{"text": "A completely different sentence."}\n'
+    )
+    # Same texts up to inner whitespace: one exact-dedup hash, but sanitization
+    # keeps the spaces, so the model input differs
+    second_input = tmp_path / "second.jsonl"
+    second_input.write_text(
+        '{"text": "Hello   World, this is a test."}\n'
+        '{"text": "A completely different sentence."}\n'
+    )
+    
+    pipeline = Pipeline(embed_cache_size=10)
+    pipeline.embedder = counting_embedder
+    for input_path in (first_input, first_input, second_input):
+        config = PipelineConfig(
+            input_path=str(input_path),
+            output_path=output_file,
+            text_column="text",
+            min_length=1,
+            dedup_threshold=0.5,
+            show_progress=False
+        )
+        assert pipeline.run(config)["success"] is True
+    
+    # The repeated run embeds nothing; the respaced text is embedded anew
+    # (sanitization lowercases the text column before Stage 2)
+    assert counting_embedder.embedded == [
+        "hello world, this is a test.",
+        "a completely different sentence.",
+        "hello   world, this is a test.",
+    ]
+
+
+@pytest.mark.parametrize("with_audit_log", [False, True], ids=["no_audit_log", "audit_log"])
+def test_pipeline_exact_dedup_normalizes_text(output_file, tmp_path, with_audit_log):
+    """Test that exact dedup ignores case/whitespace the same way with or without an audit log."""
+    data = [
+        {"text": "Hello   World, this is a test."},
+        {"text": "hello world, this is a test.  "},
+        # \x1c is whitespace to Python's str.split()/re, but not to Rust's \s
+        {"text": "Hello\x1cworld, this is a test."},
+        {"text": "A completely different sentence."},
+    ]
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+        for item in data:
+            f.write(json.dumps(item) + '\n')
+        temp_path = f.name
+    
+    try:
+        config = PipelineConfig(
+            input_path=temp_path,
+            output_path=output_file,
+            text_column="text",
+            min_length=1,
+            dedup_threshold=1.0,
+            show_progress=False,
+            audit_log_path=str(tmp_path / "audit.json") if with_audit_log else None,
+        )
+        pipeline = Pipeline()
+        result = pipeline.run(config)
+        
+        assert result["success"] is True
+        assert result["stats"]["exact_duplicates_removed"] == 2
+        # Audit events are recorded whether or not an audit log is written
+        assert [event["row_index"] for event in pipeline.audit_events] == [1, 2]
+    finally:
+        Path(temp_path).unlink()
+
+
+def test_calculate_text_hash_normalizes_case_and_whitespace():
+    """Test that hashing ignores case and whitespace differences."""
+    from entropyguard.core.pipeline import calculate_text_hash
+    
+    assert calculate_text_hash("Hello\t World \n") == calculate_text_hash("hello world")
+    assert calculate_text_hash("hello world") != calculate_text_hash("hello  worlds")
+
+
+def test_pipeline_writes_audit_log_as_json_array(sample_data_file, output_file):
+    """Test that the audit log is a JSON array of dropped-row events."""
+    audit_path = tempfile.mktemp(suffix='.json')
+    
+    try:
+        config = PipelineConfig(
+            input_path=sample_data_file,
+            output_path=output_file,
+            text_column="text",
+            min_length=10,
+            dedup_threshold=1.0,
+            audit_log_path=audit_path,
+            show_progress=False
+        )
+        pipeline = Pipeline()
+        result = pipeline.run(config)
+        
+        assert result["success"] is True
+        with open(audit_path, encoding="utf-8") as f:
+            events = json.load(f)
+        reasons = {event["reason"] for event in events}
+        assert "exact_duplicate" in reasons
+        assert len(events) == result["stats"]["audit_events"]
+        assert pipeline.audit_counts["exact_duplicate"] == sum(
+            1 for event in events if event["reason"] == "exact_duplicate"
+        )
+        assert sum(pipeline.audit_counts.values()) == len(events)
+    finally:
+        if Path(audit_path).exists():
+            Path(audit_path).unlink()
+
+
+def test_pipeline_audit_counts_without_audit_log(sample_data_file, output_file):
+    """Test that audit_counts reports dropped rows even when no audit log is written."""
+    config = PipelineConfig(
+        input_path=sample_data_file,
+        output_path=output_file,
+        text_column="text",
+        min_length=10,
+        dedup_threshold=1.0,
+        show_progress=False,
+        audit_log_path=None,
+    )
+    pipeline = Pipeline()
+    result = pipeline.run(config)
+    
+    assert result["success"] is True
+    counts = pipeline.audit_counts
+    assert counts
+    assert counts["exact_duplicate"] == result["stats"]["exact_duplicates_removed"] == 1
+    assert counts["Validation: below_min_length"] == 1
+
+
+def test_pipeline_output_excludes_internal_columns(sample_data_file, output_file):
+    """Test that pipeline bookkeeping columns are not written to the output."""
+    config = PipelineConfig(
+        input_path=sample_data_file,
+        output_path=output_file,
+        text_column="text",
+        min_length=1,
+        dedup_threshold=1.0,
+        show_progress=False
+    )
+    
+    pipeline = Pipeline()
+    result = pipeline.run(config)
+    
+    assert result["success"] is True
+    output_df = pl.read_ndjson(output_file)
+    assert "_original_index" not in output_df.columns
+    assert "_text_hash" not in output_df.columns
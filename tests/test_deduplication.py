@@ -7,6 +7,9 @@ Tests cover:
 - Duplicate detection based on semantic similarity
 """
 
+import sys
+from types import SimpleNamespace
+
 import numpy as np
 import pytest
 from typing import Any
@@ -23,6 +26,83 @@ class TestEmbedder:
         assert embedder is not None
         assert embedder.model_name == "all-MiniLM-L6-v2"
 
+    def test_embedder_batch_size(self) -> None:
+        """Test that the forward-pass batch size is configurable."""
+        embedder = Embedder(batch_size=8)
+        texts = [f"Sentence number {i} " + "word " * i for i in range(20)]
+        embeddings = embedder.embed(texts)
+
+        assert embedder.batch_size == 8
+        assert embeddings.shape == (20, 384)
+        # Output order must match input order regardless of internal length sorting
+        np.testing.assert_array_almost_equal(
+            embeddings[5], embedder.embed([texts[5]])[0], decimal=5
+        )
+
+    @pytest.mark.parametrize("device_type", ["cuda", "cpu"])
+    def test_embedder_half_precision_only_on_gpu(
+        self, monkeypatch: pytest.MonkeyPatch, device_type: str
+    ) -> None:
+        """Test that half_precision converts the model on GPU only and output stays float32."""
+
+        class FakeModel:
+            def __init__(self, model_name: str) -> None:
+                self.device = SimpleNamespace(type=device_type)
+                self.half_called = False
+
+            def half(self) -> "FakeModel":
+                self.half_called = True
+                return self
+
+            def encode(self, texts: list[str], **kwargs: Any) -> np.ndarray:
+                dtype = np.float16 if self.half_called else np.float32
+                return np.ones((len(texts), 8), dtype=dtype)
+
+        monkeypatch.setitem(
+            sys.modules,
+            "sentence_transformers",
+            SimpleNamespace(SentenceTransformer=FakeModel),
+        )
+
+        embedder = Embedder(half_precision=True)
+        embeddings = embedder.embed(["Hello world"])
+
+        assert embedder.model.half_called is (device_type == "cuda")
+        assert embeddings.dtype == np.float32
+
+    def test_embedder_dimension_without_model_metadata(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that dimension is measured when the model does not report it."""
+
+        class FakeModel:
+            def __init__(self, model_name: str) -> None:
+                self.device = SimpleNamespace(type="cpu")
+
+            def get_sentence_embedding_dimension(self) -> None:
+                return None
+
+            def encode(self, texts: list[str], **kwargs: Any) -> np.ndarray:
+                return np.ones((len(texts), 8), dtype=np.float32)
+
+        monkeypatch.setitem(
+            sys.modules,
+            "sentence_transformers",
+            SimpleNamespace(SentenceTransformer=FakeModel),
+        )
+
+        embedder = Embedder()
+
+        assert embedder.dimension == 8
+        assert embedder.embed([]).shape == (0, 8)
+
+    def test_embedder_normalize_embeddings(self) -> None:
+        """Test that normalize_embeddings returns unit-length vectors."""
+        embedder = Embedder(normalize_embeddings=True)
+        embeddings = embedder.embed(["Hello world", "Another sentence"])
+
+        np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-5)
+
     def test_embed_single_text(self) -> None:
         """Test embedding a single text string."""
         embedder = Embedder()
@@ -211,6 +291,153 @@ class TestVectorIndex:
         # With very different vectors and low threshold, should find few/no duplicates
         # (This depends on randomness, but with normalized random vectors, similarity should be low)
 
+    def test_find_duplicate_labels_point_to_first_member(self) -> None:
+        """Test that each vector is labelled with the lowest index in its group."""
+        index = VectorIndex(dimension=384, metric="ip")
+
+        vectors = np.random.randn(4, 384).astype(np.float32)
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        # Rows 4 and 5 copy row 2, row 6 copies row 0
+        index.add_vectors(np.vstack([vectors, vectors[[2, 2, 0]]]))
+
+        labels = index.find_duplicate_labels(threshold=0.95)
+
+        np.testing.assert_array_equal(labels, [0, 1, 2, 3, 2, 2, 0])
+        assert sorted(map(sorted, index.find_duplicates(threshold=0.95))) == [
+            [0, 6],
+            [2, 4, 5],
+        ]
+
+    def test_find_duplicate_labels_empty_index(self) -> None:
+        """Test that an empty index yields no labels."""
+        index = VectorIndex(dimension=384)
+        assert index.find_duplicate_labels(threshold=0.1).shape == (0,)
+
+    def test_invalid_index_type_raises(self) -> None:
+        """Test that an unknown index_type is rejected."""
+        with pytest.raises(ValueError):
+            VectorIndex(dimension=384, index_type="unknown")
+
+    @pytest.mark.parametrize("index_type", ["flat", "ivfflat", "ivfpq", "hnsw"])
+    def test_find_duplicates_index_types(self, index_type: str) -> None:
+        """Test duplicate detection with every supported index type."""
+        index = VectorIndex(dimension=384, index_type=index_type)
+
+        vectors = np.random.randn(20, 384).astype(np.float32)
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        # Row 20 is an exact copy of row 0
+        index.add_vectors(np.vstack([vectors, vectors[0:1]]))
+
+        duplicates = index.find_duplicates(threshold=0.1)
+
+        assert any(0 in group and 20 in group for group in duplicates)
+
+    def test_trained_ivf_index_is_reused(self) -> None:
+        """Test that a trained IVF index can seed a new VectorIndex without retraining."""
+        from entropyguard.deduplication.index import IVFPQ_MIN_TRAINING_POINTS
+
+        vectors = np.random.randn(IVFPQ_MIN_TRAINING_POINTS, 384).astype(np.float32)
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+        first = VectorIndex(dimension=384, index_type="ivfflat", metric="ip")
+        first.add_vectors(vectors)
+        first.find_duplicates(threshold=0.95)
+        assert first.trained_index is not None
+        assert first.trained_index.ntotal == 0
+
+        second = VectorIndex(
+            dimension=384,
+            index_type="ivfflat",
+            metric="ip",
+            trained_index=first.trained_index,
+        )
+        assert second.trained_index is first.trained_index
+        second.add_vectors(np.vstack([vectors, vectors[0:1]]))
+        duplicates = second.find_duplicates(threshold=0.95)
+
+        assert any(0 in group and len(vectors) in group for group in duplicates)
+        # A trained index of another type or metric is not reused
+        assert VectorIndex(
+            dimension=384, index_type="ivfpq", trained_index=first.trained_index
+        ).trained_index is None
+
+        # Nor one trained with the list count of a much smaller input
+        third = VectorIndex(
+            dimension=384,
+            index_type="ivfflat",
+            metric="ip",
+            trained_index=first.trained_index,
+        )
+        third.add_vectors(np.vstack([vectors] * 4))
+        third.find_duplicates(threshold=0.95)
+        assert third.trained_index is not first.trained_index
+        assert third.trained_index.nlist > first.trained_index.nlist
+
+    def test_ivfpq_keeps_near_threshold_pairs(self) -> None:
+        """Test that IVF-PQ does not merge pairs just below the threshold."""
+        from entropyguard.deduplication.index import IVFPQ_MIN_TRAINING_POINTS
+
+        rng = np.random.default_rng(0)
+        pairs = IVFPQ_MIN_TRAINING_POINTS // 2 + 1
+        base = rng.standard_normal((pairs, 128)).astype(np.float32)
+        base /= np.linalg.norm(base, axis=1, keepdims=True)
+        # Orthogonal unit offsets give every pair a cosine similarity of exactly 0.93
+        offset = rng.standard_normal((pairs, 128)).astype(np.float32)
+        offset -= np.sum(offset * base, axis=1, keepdims=True) * base
+        offset /= np.linalg.norm(offset, axis=1, keepdims=True)
+        partner = 0.93 * base + np.sqrt(1.0 - 0.93**2) * offset
+
+        index = VectorIndex(dimension=128, index_type="ivfpq", metric="ip")
+        index.add_vectors(np.vstack([base, partner]).astype(np.float32))
+        labels = index.find_duplicate_labels(threshold=0.95)
+
+        np.testing.assert_array_equal(labels, np.arange(2 * pairs))
+
+    def test_find_duplicates_inner_product_metric(self) -> None:
+        """Test that metric="ip" uses the similarity threshold directly."""
+        index = VectorIndex(dimension=384, metric="ip")
+
+        base = np.random.randn(1, 384).astype(np.float32)
+        other = np.random.randn(1, 384).astype(np.float32)
+        vectors = np.vstack([base, base, other])
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        index.add_vectors(vectors)
+
+        duplicates = index.find_duplicates(threshold=0.95)
+
+        assert duplicates == [{0, 1}]
+
+    @pytest.mark.parametrize("quantization", ["fp16", "int8", "binary"])
+    def test_find_duplicates_quantized(self, quantization: str) -> None:
+        """Test duplicate detection on quantized flat indexes."""
+        index = VectorIndex(dimension=384, metric="ip", quantization=quantization)
+
+        vectors = np.random.randn(10, 384).astype(np.float32)
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        index.add_vectors(np.vstack([vectors, vectors[3:4]]))
+
+        duplicates = index.find_duplicates(threshold=0.95)
+
+        assert any(3 in group and 10 in group for group in duplicates)
+
+    def test_quantization_requires_flat_index(self) -> None:
+        """Test that quantization cannot be combined with ANN index types."""
+        with pytest.raises(ValueError):
+            VectorIndex(dimension=384, index_type="hnsw", quantization="int8")
+
+    def test_use_gpu_falls_back_to_cpu(self) -> None:
+        """Test that use_gpu is a no-op when no GPU is available."""
+        from entropyguard.deduplication.index import gpu_available
+
+        index = VectorIndex(dimension=384, use_gpu=True)
+        assert index.use_gpu == gpu_available()
+
+        vectors = np.random.randn(5, 384).astype(np.float32)
+        index.add_vectors(np.vstack([vectors, vectors[0:1]]))
+        duplicates = index.find_duplicates(threshold=0.1)
+
+        assert any(0 in group and 5 in group for group in duplicates)
+
     def test_integration_embedder_and_index(self) -> None:
         """Integration test: Embedder + VectorIndex."""
         embedder = Embedder()
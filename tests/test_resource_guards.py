@@ -112,3 +112,17 @@ def test_estimate_file_size_nonexistent():
 
 
 
+
+
+def test_parquet_row_count_reads_footer():
+    """Test that Parquet row counts come from file metadata."""
+    import polars as pl
+    from entropyguard.core.resource_guards import parquet_row_count
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "data.parquet"
+        pl.DataFrame({"text": ["a", "b", "c"]}).write_parquet(path)
+        
+        assert parquet_row_count(str(path)) == 3
+    
+    assert parquet_row_count("/nonexistent/file.parquet") is None
@@ -183,3 +183,18 @@ def test_sanitize_lazyframe_multiple_text_columns():
     assert "world" in texts1
     assert "foo" in texts2
     assert "bar" in texts2
+
+
+def test_sanitize_lazyframe_python_only_pii_pattern():
+    """Test that patterns the native regex engine rejects still apply."""
+    df = pl.DataFrame({"text": ["id:12345 and id:999"]})
+    config = SanitizationConfig(
+        normalize_text=False,
+        remove_pii=True,
+        # Look-behind is not supported by Polars' regex engine
+        pii_patterns={"user_id": r"(?<=id:)\d+"},
+    )
+    
+    result_df = sanitize_lazyframe(df.lazy(), config, ["text"]).collect()
+    
+    assert result_df["text"][0] == "id:[USER_ID_REMOVED] and id:[USER_ID_REMOVED]"